@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Annotated, AsyncGenerator, Optional
+from typing import Annotated, Any, AsyncGenerator, Optional
 
 from fastapi import Depends, HTTPException, Request, Security, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 from sqlalchemy import select
@@ -17,22 +23,86 @@ from app.core.config import settings
 from app.core.redis import get_redis
 from app.db.session import async_session_factory
 from app.models.user import User, UserRole
+from app.services.audit_writer import enqueue_audit_entry
 
-ph = PasswordHasher()
+# Argon2id at the OWASP interactive-login baseline (19 MiB, t=2, p=1).  Hashes
+# created with the library defaults still verify; parameters live in the hash.
+ph = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
 security_scheme = HTTPBearer(auto_error=True)
 
+# Argon2 hashing is tens of milliseconds of pure CPU; run it on a dedicated pool
+# so concurrent logins never stall the event loop.
+_PW_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pwhash")
+
+# Per-process cache of validated bearer tokens.  The same token is reused across
+# every polling endpoint, so a hit skips jwt.decode, the Redis session lookup and
+# the users SELECT.  Entries live for at most _TOKEN_CACHE_TTL_SECONDS (and never
+# beyond the token's own ``exp``) so deactivations propagate quickly.
+_TOKEN_CACHE_MAX_ENTRIES = 1024
+_TOKEN_CACHE_TTL_SECONDS = 60.0
+_token_cache: OrderedDict[str, tuple[float, int, dict[str, Any]]] = OrderedDict()
+
 
 def _token_cache_key(token: str) -> str:
     digest = hashlib.sha256(token.encode()).hexdigest()[:32]
     return f"np:session:{digest}"
 
 
+def _token_cache_get(token: str) -> dict[str, Any] | None:
+    entry = _token_cache.get(token)
+    if entry is None:
+        return None
+    deadline, exp, data = entry
+    if time.monotonic() >= deadline or time.time() >= exp:
+        _token_cache.pop(token, None)
+        return None
+    _token_cache.move_to_end(token)
+    return data
+
+
+def _token_cache_put(token: str, exp: int, data: dict[str, Any]) -> None:
+    ttl = min(_TOKEN_CACHE_TTL_SECONDS, settings.access_token_expire_minutes * 60)
+    _token_cache[token] = (time.monotonic() + ttl, exp, data)
+    _token_cache.move_to_end(token)
+    while len(_token_cache) > _TOKEN_CACHE_MAX_ENTRIES:
+        _token_cache.popitem(last=False)
+
+
+def invalidate_cached_token(token: str) -> None:
+    """Drop a token from the per-process cache (logout, password change)."""
+    _token_cache.pop(token, None)
+
+
+def _user_cache_payload(user: User) -> dict[str, Any]:
+    return {
+        "id": user.id,
+        "username": user.username,
+        "email": user.email,
+        "full_name": user.full_name,
+        "role": user.role.value,
+        "is_active": user.is_active,
+        "force_password_change": user.force_password_change,
+    }
+
+
+def _user_from_cache(data: dict[str, Any]) -> User:
+    return User(
+        id=data["id"],
+        username=data.get("username"),
+        email=data["email"],
+        full_name=data.get("full_name"),
+        role=UserRole(data["role"]),
+        is_active=data["is_active"],
+        force_password_change=data.get("force_password_change", False),
+    )
+
+
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_factory() as session:
         yield session
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
+def _verify_password_sync(plain_password: str, hashed_password: str) -> bool:
     try:
         return ph.verify(hashed_password, plain_password)
     except VerifyMismatchError:
@@ -42,32 +112,57 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
-def get_password_hash(password: str) -> str:
-    return ph.hash(password)
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_PW_EXECUTOR, _verify_password_sync, plain_password, hashed_password)
+
+
+async def get_password_hash(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_PW_EXECUTOR, ph.hash, password)
 
 
 def create_access_token(
     subject: str,
     role: str,
     expires_delta: Optional[timedelta] = None,
+    user_id: Optional[int] = None,
 ) -> str:
-    to_encode = {"sub": subject, "role": role}
-    expire = datetime.utcnow() + (
+    lifetime = (
         expires_delta
         if expires_delta is not None
         else timedelta(minutes=settings.access_token_expire_minutes)
     )
-    to_encode.update({"exp": expire})
+    # RFC 7519 NumericDate: integer seconds since the epoch.
+    expire = int(time.time()) + int(lifetime.total_seconds())
+    to_encode: dict[str, Any] = {"sub": subject, "role": role, "exp": expire}
+    if user_id is not None:
+        # Lets get_current_user resolve the user by primary key.
+        to_encode["uid"] = user_id
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.jwt_algorithm)
 
 
+async def load_token_user(db: AsyncSession, payload: dict[str, Any]) -> User | None:
+    """Resolve the token's user by primary key, falling back to email for legacy tokens."""
+    email = payload.get("sub")
+    uid = payload.get("uid")
+    if isinstance(uid, int):
+        user = await db.get(User, uid)
+        # Guard against a recycled id now belonging to a different account.
+        return user if user is not None and user.email == email else None
+
+    result = await db.execute(select(User).where(User.email == email))
+    return result.scalar_one_or_none()
+
+
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Security(security_scheme)],
     db: AsyncSession = Depends(db_session),
 ) -> User:
     """Validate the bearer token and return the active User.
 
-    Checks the Redis session cache first; falls back to the database on a miss.
+    Checks the per-process token cache, then the Redis session cache, and
+    falls back to the database on a miss.
     """
     token = credentials.credentials
     redis = get_redis()
@@ -77,6 +172,7 @@ async def get_current_user(
     # Check if token is blacklisted
     try:
         if await redis.get(f"np:blacklist:{digest}"):
+            invalidate_cached_token(token)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Token has been blacklisted (logged out)",
@@ -86,6 +182,10 @@ async def get_current_user(
     except Exception:
         pass
 
+    cached_user = _token_cache_get(token)
+    if cached_user is not None:
+        return _user_from_cache(cached_user)
+
     try:
         payload = jwt.decode(
             token,
@@ -98,38 +198,31 @@ async def get_current_user(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid authentication credentials",
             )
-    except JWTError:
+    except InvalidTokenError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         ) from None
 
-    redis = get_redis()
+    exp: int = payload.get("exp", 0)
     cache_key = _token_cache_key(token)
     try:
         cached = await redis.get(cache_key)
         if cached:
             data = json.loads(cached)
-            user = User(
-                id=data["id"],
-                email=data["email"],
-                full_name=data.get("full_name"),
-                role=UserRole(data["role"]),
-                is_active=data["is_active"],
-            )
-            if not user.is_active:
+            if not data["is_active"]:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
                     detail="Inactive or missing user",
                 )
-            return user
+            _token_cache_put(token, exp, data)
+            return _user_from_cache(data)
     except HTTPException:
         raise
     except Exception:
         pass
 
-    result = await db.execute(select(User).where(User.email == email))
-    user = result.scalar_one_or_none()
+    user = await load_token_user(db, payload)
 
     if user is None or not user.is_active:
         raise HTTPException(
@@ -137,31 +230,32 @@ async def get_current_user(
             detail="Inactive or missing user",
         )
 
-    exp: int = payload.get("exp", 0)
-    ttl = max(exp - int(datetime.utcnow().timestamp()), 60)
+    data = _user_cache_payload(user)
+    _token_cache_put(token, exp, data)
+    ttl = max(exp - int(time.time()), 60)
     try:
-        await redis.setex(
-            cache_key,
-            ttl,
-            json.dumps({
-                "id": user.id,
-                "email": user.email,
-                "full_name": user.full_name,
-                "role": user.role.value,
-                "is_active": user.is_active,
-            }),
-        )
+        await redis.setex(cache_key, ttl, json.dumps(data))
     except Exception:
         pass
 
     return user
 
 
+@lru_cache(maxsize=None)
 def require_role(*allowed_roles: UserRole):
-    """Return a dependency that requires authentication and optionally a specific role."""
+    """Return a dependency that requires authentication and optionally a specific role.
+
+    Memoised per role set so every ``Depends(require_role(...))`` site shares one
+    callable, which lets FastAPI's per-request dependency cache dedupe it.
+    """
+
+    if not allowed_roles:
+        return get_current_user
+
+    allowed = frozenset(allowed_roles)
 
     async def _require(user: User = Depends(get_current_user)) -> User:
-        if allowed_roles and user.role not in allowed_roles:
+        if user.role not in allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions",
@@ -183,29 +277,31 @@ async def require_admin(
     request: Request,
     user: User = Depends(get_current_user),
 ) -> User:
+    """Require the ADMIN role and record the call in the audit trail.
+
+    The audit row is queued for the background writer in
+    ``app.services.audit_writer`` so the request never waits on an INSERT.
+    """
     if user.role != UserRole.ADMIN:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin privileges required",
         )
 
-    try:
-        from app.core.celery_app import celery_app
-
-        celery_app.send_task(
-            "app.tasks.write_audit_log",
-            kwargs={
-                "user_id": user.id,
-                "method": request.method,
-                "path": request.url.path,
-                "ip_address": getattr(request.client, "host", None),
-                "details": {
-                    "query": dict(request.query_params),
-                    "path_params": request.scope.get("path_params", {}),
-                },
+    enqueue_audit_entry(
+        {
+            "user_id": user.id,
+            "method": request.method,
+            "path": request.url.path,
+            "action": f"{request.method} {request.url.path}",
+            "ip_address": getattr(request.client, "host", None),
+            "details": {
+                "query": dict(request.query_params),
+                "path_params": request.scope.get("path_params", {}),
             },
-        )
-    except Exception:
-        pass
+            "created_at": datetime.utcnow(),
+        }
+    )
 
     return user
+
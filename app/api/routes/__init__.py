@@ -1,59 +1,43 @@
+from importlib import import_module
+
 from fastapi import APIRouter
 
-from app.api.routes import (
-    auth,
-    backup,
-    captures,
-    device_actions,
-    devices,
-    google_auth,
-    health,
-    logs,
-    metrics,
-    network_segments,
-    nmap,
-    packets,
-    pcaps,
-    playbooks,
-    plugins,
-    recon,
-    reports,
-    routers,
-    scripts,
-    settings,
-    snmp,
-    syslog_receiver,
-    threat_intel,
-    uptime,
-    ws,
-)
 from app.plugins import load_builtin_plugins
 
+# (module name, prefix, tags) for every router mounted under /api.  Modules are
+# imported by name so a route can be dropped from the table without touching an
+# import block, and nothing is imported that is not actually mounted.
+ROUTES: list[tuple[str, str, list[str] | None]] = [
+    ("health", "/health", ["health"]),
+    ("auth", "/auth", ["auth"]),
+    ("google_auth", "/auth/google", ["auth"]),
+    ("scripts", "/scripts", ["scripts"]),
+    ("recon", "/recon", ["recon"]),
+    ("devices", "/devices", ["devices"]),
+    ("routers", "/routers", ["routers"]),
+    ("metrics", "/metrics", ["metrics"]),
+    ("captures", "/captures", ["captures"]),
+    ("pcaps", "/pcaps", ["pcaps"]),
+    ("packets", "/packets", ["packets"]),
+    ("network_segments", "/network-segments", ["network-segments"]),
+    ("playbooks", "/playbooks", ["playbooks"]),
+    ("reports", "/reports", ["reports"]),
+    ("threat_intel", "/threat-intel", ["threat-intel"]),
+    ("logs", "/logs", ["logs"]),
+    ("ws", "/ws", ["ws"]),
+    ("nmap", "/nmap", ["nmap"]),
+    ("uptime", "", None),
+    ("snmp", "/snmp", ["snmp"]),
+    ("syslog_receiver", "/syslog", ["syslog"]),
+    ("device_actions", "/device-actions", ["device-actions"]),
+    ("backup", "/backup", ["backup"]),
+    ("settings", "/settings", ["settings"]),
+    ("plugins", "/plugins", ["plugins"]),
+]
+
 api_router = APIRouter()
-api_router.include_router(health.router, prefix="/health", tags=["health"])
-api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
-api_router.include_router(google_auth.router, prefix="/auth/google", tags=["auth"])
-api_router.include_router(scripts.router, prefix="/scripts", tags=["scripts"])
-api_router.include_router(recon.router, prefix="/recon", tags=["recon"])
-api_router.include_router(devices.router, prefix="/devices", tags=["devices"])
-api_router.include_router(routers.router, prefix="/routers", tags=["routers"])
-api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
-api_router.include_router(captures.router, prefix="/captures", tags=["captures"])
-api_router.include_router(pcaps.router, prefix="/pcaps", tags=["pcaps"])
-api_router.include_router(packets.router, prefix="/packets", tags=["packets"])
-api_router.include_router(network_segments.router, prefix="/network-segments", tags=["network-segments"])
-api_router.include_router(playbooks.router, prefix="/playbooks", tags=["playbooks"])
-api_router.include_router(reports.router, prefix="/reports", tags=["reports"])
-api_router.include_router(threat_intel.router, prefix="/threat-intel", tags=["threat-intel"])
-api_router.include_router(logs.router, prefix="/logs", tags=["logs"])
-api_router.include_router(ws.router, prefix="/ws", tags=["ws"])
-api_router.include_router(nmap.router, prefix="/nmap", tags=["nmap"])
-api_router.include_router(uptime.router)
-api_router.include_router(snmp.router, prefix="/snmp", tags=["snmp"])
-api_router.include_router(syslog_receiver.router, prefix="/syslog", tags=["syslog"])
-api_router.include_router(device_actions.router, prefix="/device-actions", tags=["device-actions"])
-api_router.include_router(backup.router, prefix="/backup", tags=["backup"])
-api_router.include_router(settings.router, prefix="/settings", tags=["settings"])
-api_router.include_router(plugins.router, prefix="/plugins", tags=["plugins"])
+for _name, _prefix, _tags in ROUTES:
+    _module = import_module(f"{__name__}.{_name}")
+    api_router.include_router(_module.router, prefix=_prefix, tags=_tags)
 
 load_builtin_plugins()
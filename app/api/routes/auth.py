@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import secrets
+import time
 from datetime import datetime, timedelta
 from typing import Any, Dict
 
+import jwt
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from email_validator import EmailNotValidError, validate_email
 from pydantic import BaseModel, field_validator
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import (
@@ -17,6 +21,8 @@ from app.api.deps import (
     db_session,
     get_current_user,
     get_password_hash,
+    invalidate_cached_token,
+    ph,
     verify_password,
     security_scheme,
 )
@@ -28,6 +34,8 @@ logger = logging.getLogger("netpulse.auth")
 
 router = APIRouter()
 
+_DUMMY_PASSWORD_HASH = ph.hash(secrets.token_urlsafe(16))
+
 _RATE_LIMIT_KEY_PREFIX = "np:login_attempts:"
 _RATE_LIMIT_MAX_ATTEMPTS = 5
 _RATE_LIMIT_WINDOW_SECONDS = 300
@@ -37,41 +45,30 @@ def _rate_limit_key_for_ip(client_ip: str) -> str:
     return f"{_RATE_LIMIT_KEY_PREFIX}{client_ip}"
 
 
-async def _enforce_login_rate_limit(request: Request) -> None:
-    """Block the request if the client IP has exceeded the login attempt ceiling.
+async def login_rate_limit_exceeded(client_ip: str) -> bool:
+    """Record a login attempt for ``client_ip`` and report whether it is over the ceiling.
 
     Uses a Redis sorted-set sliding window: timestamps are members scored by their
     Unix epoch, so ZREMRANGEBYSCORE + ZCARD runs atomically in a single pipeline.
-    
-    Extracts the real client IP from X-Forwarded-For or X-Real-IP headers to
-    properly handle proxied requests.
+    Called from ``LoginRateLimitMiddleware`` in app/main.py, which resolves the
+    real client IP from proxy headers before the request reaches FastAPI.
     """
-    # Extract real client IP, handling proxy headers
-    client_ip = request.client.host if request.client else "unknown"
-    if x_forwarded_for := request.headers.get("X-Forwarded-For"):
-        # X-Forwarded-For may contain multiple IPs; use the first (client) one
-        client_ip = x_forwarded_for.split(",")[0].strip()
-    elif x_real_ip := request.headers.get("X-Real-IP"):
-        client_ip = x_real_ip.strip()
-    
     redis_client = get_redis()
     rate_limit_key = _rate_limit_key_for_ip(client_ip)
-    current_unix_time = datetime.utcnow().timestamp()
+    current_unix_time = time.time()
     window_start_time = current_unix_time - _RATE_LIMIT_WINDOW_SECONDS
 
     async with redis_client.pipeline(transaction=True) as pipeline:
         pipeline.zremrangebyscore(rate_limit_key, "-inf", window_start_time)
         pipeline.zcard(rate_limit_key)
-        pipeline.zadd(rate_limit_key, {str(current_unix_time): current_unix_time})
+        # Unique member per attempt: two requests in the same clock tick must
+        # not collapse into one sorted-set entry and slip past the limit.
+        pipeline.zadd(rate_limit_key, {f"{current_unix_time}:{secrets.token_hex(4)}": current_unix_time})
         pipeline.expire(rate_limit_key, _RATE_LIMIT_WINDOW_SECONDS)
         results = await pipeline.execute()
 
     attempt_count_before_this_request = results[1]
-    if attempt_count_before_this_request >= _RATE_LIMIT_MAX_ATTEMPTS:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Too many login attempts. Please try again later.",
-        )
+    return attempt_count_before_this_request >= _RATE_LIMIT_MAX_ATTEMPTS
 
 
 class TokenResponse(BaseModel):
@@ -135,15 +132,18 @@ class UserMeResponse(BaseModel):
     "/login",
     response_model=TokenResponse,
     summary="Obtain an access token via email and password",
-    dependencies=[Depends(_enforce_login_rate_limit)],
 )
 async def login(
     payload: LoginRequest,
     db: AsyncSession = Depends(db_session),
 ) -> TokenResponse:
     """Authenticate a user and return a JWT access token."""
-    result = await db.execute(select(User).where(User.username == payload.username))
-    user = result.scalar_one_or_none()
+    user = await db.scalar(select(User).where(User.username == payload.username))
+
+    if user is None or user.auth_provider != "local" or not user.hashed_password:
+        # Pay the same KDF cost as a real verification so response time does not
+        # reveal whether the username exists.
+        await verify_password(payload.password, _DUMMY_PASSWORD_HASH)
 
     if user is None:
         raise HTTPException(
@@ -157,7 +157,7 @@ async def login(
             detail="This account uses Google sign-in. Please use the Google button to log in.",
         )
 
-    if not verify_password(payload.password, user.hashed_password):
+    if not await verify_password(payload.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -172,6 +172,7 @@ async def login(
         subject=user.email,
         role=user.role.value,
         expires_delta=access_token_expires,
+        user_id=user.id,
     )
     return TokenResponse(access_token=token)
 
@@ -188,6 +189,7 @@ async def logout(
     auth_header = request.headers.get("Authorization")
     if auth_header and auth_header.startswith("Bearer "):
         token = auth_header.split(" ")[1]
+        invalidate_cached_token(token)
         try:
             # Decode token (ignore expiration verification to find remaining TTL)
             payload = jwt.decode(
@@ -197,7 +199,7 @@ async def logout(
                 options={"verify_exp": False},
             )
             exp = payload.get("exp", 0)
-            current_time = int(datetime.utcnow().timestamp())
+            current_time = int(time.time())
             ttl = max(exp - current_time, 0)
             
             if ttl > 0:
@@ -252,18 +254,10 @@ async def create_user(
         open signups entirely; additional users must be created by an admin
         through a controlled path (e.g. internal tooling or SSO provisioning).
     """
-    existing_any = await db.execute(select(User).limit(1))
-    first_user = existing_any.scalar_one_or_none()
-
-    existing = await db.execute(select(User).where((User.email == payload.email) | (User.username == payload.username)))
-    if existing.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User with this email or username already exists",
-        )
+    has_users = await db.scalar(select(select(User.id).exists()))
 
     # First user requires SETUP_TOKEN to prevent unauthorized admin takeover
-    if not first_user:
+    if not has_users:
         setup_token_env = os.environ.get("SETUP_TOKEN", "").strip()
         if not setup_token_env:
             raise HTTPException(
@@ -276,7 +270,7 @@ async def create_user(
                 detail="Invalid setup token.",
             )
 
-    if first_user and not settings.allow_open_signup:
+    if has_users and not settings.allow_open_signup:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User signup is disabled. Ask an administrator to provision access.",
@@ -286,16 +280,33 @@ async def create_user(
         username=payload.username,
         email=payload.email,
         full_name=payload.full_name,
-        hashed_password=get_password_hash(payload.password),
-        role=UserRole.ADMIN if not first_user else UserRole.OPERATOR,
+        hashed_password=await get_password_hash(payload.password),
+        role=UserRole.OPERATOR if has_users else UserRole.ADMIN,
     )
     db.add(user)
-    await db.commit()
-    await db.refresh(user)
+    # email and username carry unique indexes, so a duplicate surfaces here
+    # instead of via a racy pre-check SELECT.
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User with this email or username already exists",
+        ) from None
 
     return {"id": user.id, "email": user.email, "role": user.role.value}
 
 
+_RESET_TOKEN_KEY_PREFIX = "np:pwreset:"
+_RESET_TOKEN_TTL_SECONDS = 3600
+
+
+def _reset_token_key(token: str) -> str:
+    # Only the digest is stored so a Redis dump never exposes usable tokens.
+    return f"{_RESET_TOKEN_KEY_PREFIX}{hashlib.sha256(token.encode()).hexdigest()}"
+
+
 class ForgotPasswordRequest(EmailRequest):
     pass
 
@@ -320,8 +331,7 @@ async def update_password(
     db: AsyncSession = Depends(db_session),
 ) -> Dict[str, str]:
     # Retrieve the user directly from the database to ensure it's attached and has all fields loaded
-    result = await db.execute(select(User).where(User.id == user.id))
-    db_user = result.scalar_one_or_none()
+    db_user = await db.get(User, user.id)
     if not db_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -334,7 +344,7 @@ async def update_password(
             detail="New password must be at least 6 characters.",
         )
 
-    db_user.hashed_password = get_password_hash(payload.new_password)
+    db_user.hashed_password = await get_password_hash(payload.new_password)
     db_user.force_password_change = False
     await db.commit()
 
@@ -342,6 +352,7 @@ async def update_password(
     auth_header = request.headers.get("Authorization")
     if auth_header and auth_header.startswith("Bearer "):
         token = auth_header.split(" ")[1]
+        invalidate_cached_token(token)
         import hashlib
         digest = hashlib.sha256(token.encode()).hexdigest()[:32]
         cache_key = f"np:session:{digest}"
@@ -362,20 +373,14 @@ async def forgot_password(
     payload: ForgotPasswordRequest,
     db: AsyncSession = Depends(db_session),
 ) -> Dict[str, str]:
-    result = await db.execute(select(User).where(User.email == payload.email))
-    user = result.scalar_one_or_none()
+    user = await db.scalar(select(User).where(User.email == payload.email))
 
     if user is None or user.auth_provider != "local":
         # Return generic message to prevent user enumeration
         return {"message": "If an account with that email exists, a reset link has been generated."}
 
     token = secrets.token_urlsafe(32)
-    import hashlib
-    hashed_token = hashlib.sha256(token.encode()).hexdigest()
-
-    user.reset_token = hashed_token
-    user.reset_token_expires = datetime.utcnow() + timedelta(hours=1)
-    await db.commit()
+    await get_redis().set(_reset_token_key(token), str(user.id), ex=_RESET_TOKEN_TTL_SECONDS)
 
     # Log the plaintext token to the console so the administrator can copy-paste it
     logger.warning("PASSWORD RESET REQUESTED FOR %s. RESET TOKEN: %s", user.email, token)
@@ -397,17 +402,9 @@ async def reset_password(
             detail="Password must be at least 6 characters.",
         )
 
-    import hashlib
-    hashed_token = hashlib.sha256(payload.token.encode()).hexdigest()
-
-    # Find the user with the matching, unexpired reset token
-    result = await db.execute(
-        select(User).where(
-            User.reset_token == hashed_token,
-            User.reset_token_expires > datetime.utcnow()
-        )
-    )
-    user = result.scalar_one_or_none()
+    # GETDEL consumes the token atomically, so it can only ever be redeemed once.
+    user_id = await get_redis().getdel(_reset_token_key(payload.token))
+    user = await db.get(User, int(user_id)) if user_id else None
 
     if not user:
         raise HTTPException(
@@ -415,9 +412,7 @@ async def reset_password(
             detail="Invalid or expired reset token.",
         )
 
-    user.hashed_password = get_password_hash(payload.new_password)
-    user.reset_token = None
-    user.reset_token_expires = None
+    user.hashed_password = await get_password_hash(payload.new_password)
     user.force_password_change = False
     await db.commit()
 
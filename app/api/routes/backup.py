@@ -1,17 +1,24 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import os
+import re
+import time
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, BinaryIO, Dict, List
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
 from fastapi.responses import FileResponse
-from sqlalchemy import text
+from sqlalchemy import column, insert, table as sql_table, text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import db_session, require_admin
+from app.api.uploads import iter_upload
+from app.core.config import settings
 from app.models.user import User
 
 router = APIRouter()
@@ -21,9 +28,11 @@ BACKUP_DIR.mkdir(parents=True, exist_ok=True)
 
 EXPORTABLE_TABLES = ["devices", "uptime_targets", "network_segments"]
 FILENAME_PATTERN = "netpulse_backup_"
+# Exactly what export_db produces: the prefix plus a %Y%m%d_%H%M%S timestamp.
+_BACKUP_NAME_RE = re.compile(rf"{FILENAME_PATTERN}[0-9]{{8}}_[0-9]{{6}}\.json")
 
-TABLE_COLUMN_ALLOWLIST = {
-    "devices": {
+TABLE_COLUMN_ALLOWLIST: Dict[str, frozenset[str]] = {
+    "devices": frozenset({
         "id",
         "hostname",
         "ip_address",
@@ -36,8 +45,8 @@ TABLE_COLUMN_ALLOWLIST = {
         "last_seen",
         "created_at",
         "updated_at",
-    },
-    "uptime_targets": {
+    }),
+    "uptime_targets": frozenset({
         "id",
         "name",
         "target",
@@ -49,8 +58,8 @@ TABLE_COLUMN_ALLOWLIST = {
         "last_checked_at",
         "last_latency_ms",
         "consecutive_failures",
-    },
-    "network_segments": {
+    }),
+    "network_segments": frozenset({
         "id",
         "name",
         "cidr",
@@ -60,45 +69,103 @@ TABLE_COLUMN_ALLOWLIST = {
         "scan_enabled",
         "created_at",
         "updated_at",
-    },
+    }),
 }
 
 
+# Timestamp columns of the exportable tables.  Exports write them as RFC 3339
+# strings; asyncpg only binds datetime objects, so restore parses them back.
+_DATETIME_COLUMNS: frozenset[str] = frozenset({"created_at", "last_checked_at", "last_seen", "updated_at"})
+
+_EXPORT_BATCH_ROWS = 1000
+_RESTORE_BATCH_ROWS = 500
+
+_ALLOWED_TABLES: frozenset[str] = frozenset(EXPORTABLE_TABLES)
+
+# One Core INSERT per restorable table, built once.  Executed with a list of
+# row dicts it renders only the columns present in the batch.
+_RESTORE_INSERTS = {
+    name: insert(sql_table(name, *(column(col) for col in sorted(columns))))
+    for name, columns in TABLE_COLUMN_ALLOWLIST.items()
+}
+
+
+async def _stream_table_rows(db: AsyncSession, table: str, fh: BinaryIO) -> None:
+    """Write every row of ``table`` to ``fh`` as comma-separated JSON objects.
+
+    Rows come off a server-side cursor and are flushed to disk in batches from
+    a worker thread, so neither the full table nor the disk I/O sits on the
+    event loop.
+    """
+    result = await db.stream(
+        text(f"SELECT * FROM {table}").execution_options(yield_per=_EXPORT_BATCH_ROWS)
+    )
+    separator = b""
+    async for partition in result.mappings().partitions():
+        # orjson serialises datetimes natively; ``default=str`` only fires for
+        # the odd type it does not know.
+        chunk = separator + b",".join(orjson.dumps(dict(row), default=str) for row in partition)
+        await asyncio.to_thread(fh.write, chunk)
+        separator = b","
+
+
 @router.post("/export")
 async def export_db(
     db: AsyncSession = Depends(db_session),
     current_user: User = Depends(require_admin),
 ):
-    data: Dict[str, Any] = {}
-    for table in EXPORTABLE_TABLES:
-        try:
-            result = await db.execute(text(f"SELECT * FROM {table}"))
-            rows = result.mappings().all()
-            data[table] = [dict(row) for row in rows]
-        except Exception:
-            data[table] = []
-
-    filename = f"netpulse_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    filename = f"{FILENAME_PATTERN}{time.strftime('%Y%m%d_%H%M%S')}.json"
     filepath = BACKUP_DIR / filename
-    with open(filepath, "w") as f:
-        json.dump(data, f, default=str, indent=2)
+    # Stream into a name the listing glob ignores and rename it into place once
+    # complete: the rename is what updates BACKUP_DIR's mtime, so the cached
+    # listing never shows a half-written export or a stale size.
+    partial = filepath.with_name(filename + ".part")
+    try:
+        with open(partial, "wb") as f:
+            f.write(b"{")
+            for index, table in enumerate(EXPORTABLE_TABLES):
+                f.write((b"," if index else b"") + orjson.dumps(table) + b":[")
+                try:
+                    await _stream_table_rows(db, table, f)
+                except Exception:
+                    # Missing tables export as an empty list, as before.
+                    pass
+                f.write(b"]")
+            f.write(b"}")
+        await asyncio.to_thread(os.replace, partial, filepath)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
 
     return FileResponse(filepath, filename=filename, media_type="application/json")
 
 
+@lru_cache(maxsize=1)
+def _list_backups_cached(dir_mtime_ns: int) -> tuple[Dict[str, Any], ...]:
+    # Keyed on the directory mtime.  Exports only appear via os.replace of a
+    # finished file, so every visible change (new, overwritten or deleted
+    # backup) bumps it, and an unchanged directory costs one stat() per request.
+    entries = []
+    for file in BACKUP_DIR.glob("netpulse_backup_*.json"):
+        stat = file.stat()
+        entries.append((stat.st_mtime, file.name, stat.st_size))
+    entries.sort(reverse=True)
+    return tuple(
+        {
+            "filename": name,
+            "size": size,
+            "created_at": datetime.fromtimestamp(mtime).isoformat(),
+        }
+        for mtime, name, size in entries
+    )
+
+
 @router.get("/list")
 async def list_backups(
     current_user: User = Depends(require_admin),
 ) -> List[Dict[str, Any]]:
-    backups = []
-    for file in sorted(BACKUP_DIR.glob("netpulse_backup_*.json"), key=lambda f: f.stat().st_mtime, reverse=True):
-        stat = file.stat()
-        backups.append({
-            "filename": file.name,
-            "size": stat.st_size,
-            "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-        })
-    return backups
+    cached = _list_backups_cached(BACKUP_DIR.stat().st_mtime_ns)
+    return [dict(entry) for entry in cached]
 
 
 @router.get("/{filename}")
@@ -106,12 +173,9 @@ async def download_backup(
     filename: str,
     current_user: User = Depends(require_admin),
 ) -> FileResponse:
-    if not filename.startswith(FILENAME_PATTERN) or not filename.endswith(".json"):
+    if not _BACKUP_NAME_RE.fullmatch(filename):
         raise HTTPException(status_code=400, detail="Invalid backup filename format")
 
-    if ".." in filename or "/" in filename or "\\" in filename:
-        raise HTTPException(status_code=400, detail="Invalid filename")
-
     filepath = BACKUP_DIR / filename
     if not filepath.exists() or not filepath.is_file():
         raise HTTPException(status_code=404, detail="Backup file not found")
@@ -124,20 +188,44 @@ async def delete_backup(
     filename: str,
     current_user: User = Depends(require_admin),
 ) -> Dict[str, str]:
-    if not filename.startswith(FILENAME_PATTERN) or not filename.endswith(".json"):
+    if not _BACKUP_NAME_RE.fullmatch(filename):
         raise HTTPException(status_code=400, detail="Invalid backup filename format")
 
-    if ".." in filename or "/" in filename or "\\" in filename:
-        raise HTTPException(status_code=400, detail="Invalid filename")
-
     filepath = BACKUP_DIR / filename
-    if not filepath.exists():
-        raise HTTPException(status_code=404, detail="Backup file not found")
-
-    os.remove(filepath)
+    try:
+        await asyncio.to_thread(os.remove, filepath)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Backup file not found") from None
     return {"status": "deleted", "filename": filename}
 
 
+async def _insert_batch(db: AsyncSession, statement: Any, batch: List[Dict[str, Any]]) -> int:
+    """Insert ``batch`` and return how many of its rows were written.
+
+    Each attempt runs in a savepoint so a failed INSERT rolls back only itself
+    instead of aborting the whole restore transaction (as it would on
+    Postgres).  If the batch fails, its rows are retried one at a time so a
+    single bad row only costs that row.
+    """
+    try:
+        async with db.begin_nested():
+            await db.execute(statement, batch)
+        return len(batch)
+    except SQLAlchemyError:
+        if len(batch) == 1:
+            return 0
+
+    inserted = 0
+    for row in batch:
+        try:
+            async with db.begin_nested():
+                await db.execute(statement, row)
+            inserted += 1
+        except SQLAlchemyError:
+            continue
+    return inserted
+
+
 @router.post("/restore")
 async def restore_db(
     file: UploadFile = File(...),
@@ -147,20 +235,19 @@ async def restore_db(
     if not file.filename or not file.filename.endswith(".json"):
         raise HTTPException(status_code=400, detail="Only JSON backup files are accepted")
 
+    content = b"".join([chunk async for chunk in iter_upload(file, settings.max_backup_upload_bytes)])
     try:
-        content = await file.read()
-        data = json.loads(content)
-    except (json.JSONDecodeError, Exception) as e:
+        data = orjson.loads(content)
+    except (orjson.JSONDecodeError, Exception) as e:
         raise HTTPException(status_code=400, detail=f"Invalid JSON file: {str(e)}")
 
     if not isinstance(data, dict):
         raise HTTPException(status_code=400, detail="Backup file must contain a JSON object")
 
     counts: Dict[str, int] = {}
-    allowed_tables = set(EXPORTABLE_TABLES)
 
     for table_name, rows in data.items():
-        if table_name not in allowed_tables:
+        if table_name not in _ALLOWED_TABLES:
             continue
         if not isinstance(rows, list):
             continue
@@ -170,11 +257,14 @@ async def restore_db(
             continue
 
         try:
-            await db.execute(text(f"DELETE FROM {table_name}"))
-        except Exception:
+            async with db.begin_nested():
+                await db.execute(text(f"DELETE FROM {table_name}"))
+        except SQLAlchemyError:
             pass
 
-        inserted = 0
+        # Group rows by column set so each group can go out as one executemany
+        # batch instead of one INSERT round-trip per row.
+        groups: Dict[tuple[str, ...], List[Dict[str, Any]]] = {}
         for row in rows:
             if not isinstance(row, dict):
                 continue
@@ -189,21 +279,24 @@ async def restore_db(
                     ),
                 )
 
-            filtered_row = {k: v for k, v in row.items() if k in allowed_columns}
-            if not filtered_row:
-                continue
+            for name in _DATETIME_COLUMNS.intersection(row):
+                if isinstance(row[name], str):
+                    try:
+                        row[name] = datetime.fromisoformat(row[name])
+                    except ValueError:
+                        raise HTTPException(
+                            status_code=400,
+                            detail=f"Invalid timestamp in '{table_name}.{name}': {row[name]}",
+                        ) from None
 
-            column_names = list(filtered_row.keys())
-            columns = ", ".join(column_names)
-            placeholders = ", ".join(f":{k}" for k in column_names)
-            try:
-                await db.execute(
-                    text(f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"),
-                    filtered_row,
-                )
-                inserted += 1
-            except Exception:
-                continue
+            if row:
+                groups.setdefault(tuple(sorted(row)), []).append(row)
+
+        inserted = 0
+        statement = _RESTORE_INSERTS[table_name]
+        for group in groups.values():
+            for start in range(0, len(group), _RESTORE_BATCH_ROWS):
+                inserted += await _insert_batch(db, statement, group[start:start + _RESTORE_BATCH_ROWS])
 
         counts[table_name] = inserted
 
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime
 from pathlib import Path
 from typing import Any, List, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
-from pydantic import BaseModel
+from pydantic import BaseModel, field_serializer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import db_session, require_admin, require_compliance_role
 from app.models.packet_capture import PacketCapture, PacketCaptureStatus
-from app.services.packet_capture import capture_to_pcap, get_capture_stats, parse_pcap_headers
+from app.services.packet_capture import (
+    capture_to_pcap,
+    get_capture_stats,
+    parse_pcap_headers,
+    sniff_pcap_file,
+)
 
 router = APIRouter()
 
@@ -24,19 +31,23 @@ class StartCaptureRequest(BaseModel):
 class CaptureResponse(BaseModel):
     id: int
     filename: str
-    status: str
+    status: PacketCaptureStatus
     interface: Optional[str]
     bpf_filter: Optional[str]
     duration_seconds: int
     packet_count: int
     file_size_bytes: int
-    started_at: Optional[str]
-    finished_at: Optional[str]
+    started_at: Optional[datetime]
+    finished_at: Optional[datetime]
     error_message: Optional[str]
 
     class Config:
         from_attributes = True
 
+    @field_serializer("started_at", "finished_at")
+    def _serialize_timestamp(self, value: Optional[datetime]) -> Optional[str]:
+        return value.isoformat() if value else None
+
 
 @router.post(
     "/start",
@@ -83,30 +94,28 @@ async def list_captures(
     limit: int = 50,
     offset: int = 0,
 ) -> List[CaptureResponse]:
+    # Project only the listed columns: plain row tuples skip ORM hydration and
+    # identity-map bookkeeping for every capture on the page.
     result = await db.execute(
-        select(PacketCapture)
+        select(
+            PacketCapture.id,
+            PacketCapture.filename,
+            PacketCapture.status,
+            PacketCapture.interface,
+            PacketCapture.bpf_filter,
+            PacketCapture.duration_seconds,
+            PacketCapture.packet_count,
+            PacketCapture.file_size_bytes,
+            PacketCapture.started_at,
+            PacketCapture.finished_at,
+            PacketCapture.error_message,
+        )
         .order_by(PacketCapture.created_at.desc())
         .limit(limit)
         .offset(offset)
     )
-    captures = result.scalars().all()
-
-    return [
-        CaptureResponse(
-            id=c.id,
-            filename=c.filename,
-            status=c.status.value,
-            interface=c.interface,
-            bpf_filter=c.bpf_filter,
-            duration_seconds=c.duration_seconds,
-            packet_count=c.packet_count,
-            file_size_bytes=c.file_size_bytes,
-            started_at=c.started_at.isoformat() if c.started_at else None,
-            finished_at=c.finished_at.isoformat() if c.finished_at else None,
-            error_message=c.error_message,
-        )
-        for c in captures
-    ]
+
+    return [CaptureResponse.model_validate(c) for c in result]
 
 
 @router.get(
@@ -144,7 +153,14 @@ async def parse_capture(
             detail=f"Capture is not completed (status: {capture.status.value})",
         )
 
-    headers_parsed = await parse_pcap_headers(db, capture_id, max_packets)
+    try:
+        problem = await asyncio.to_thread(sniff_pcap_file, capture.filepath)
+    except FileNotFoundError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Capture file not found") from None
+    if problem:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=problem)
+
+    headers_parsed = await parse_pcap_headers(db, capture_id, max_packets) if max_packets > 0 else 0
 
     return {
         "capture_id": capture_id,
@@ -167,9 +183,8 @@ async def delete_capture(
     if not capture:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Capture not found")
 
-    filepath = Path(capture.filepath)
-    if filepath.exists():
-        filepath.unlink()
+    # unlink can block for a long time on network-mounted capture storage.
+    await asyncio.to_thread(Path(capture.filepath).unlink, missing_ok=True)
 
     await db.delete(capture)
     await db.commit()
@@ -4,50 +4,50 @@ import asyncio
 import ipaddress
 import logging
 import re
-import shutil
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any, Dict, List
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import distinct_on
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import db_session, require_admin, require_compliance_role
 from app.core.config import settings
+from app.core.tools import resolve_tool
 from app.models.enforcement_action import EnforcementAction
 from app.models.user import User
+from app.services import arp_spoof
 from app.services.enforcement import isolate_switch_port
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-MAC_PATTERN = re.compile(r"^([0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2}$")
+# Used with fullmatch(): unlike "$", it does not accept a trailing newline.
+MAC_PATTERN = re.compile(r"[0-9A-Fa-f]{2}(?:[:-][0-9A-Fa-f]{2}){5}", re.ASCII)
 
 
+@lru_cache(maxsize=4096)
 def _validate_ip(ip: str) -> bool:
     """Validate an IPv4 address."""
     try:
-        return isinstance(ipaddress.ip_address(ip), ipaddress.IPv4Address)
+        ipaddress.IPv4Address(ip)
     except ValueError:
         return False
+    return True
 
 
-async def _get_latest_action(db: AsyncSession, ip: str) -> EnforcementAction | None:
+async def _get_current_state(db: AsyncSession, ip: str) -> str | None:
+    """Return the action_type of the most recent enforcement action for ``ip``."""
     stmt = (
-        select(EnforcementAction)
+        select(EnforcementAction.action_type)
         .where(EnforcementAction.ip == ip)
         .order_by(EnforcementAction.created_at.desc())
         .limit(1)
     )
-    return (await db.execute(stmt)).scalars().first()
-
-
-async def _get_current_state(db: AsyncSession, ip: str) -> str | None:
-    latest = await _get_latest_action(db, ip)
-    if latest is None:
-        return None
-    return latest.action_type
+    return await db.scalar(stmt)
 
 
 class BlockRequest(BaseModel):
@@ -91,23 +91,22 @@ async def block_device(
 
     current_state = await _get_current_state(db, request.ip)
     note: str | None = None
+    now = datetime.now(timezone.utc)
 
     # Idempotent behaviour: if it's already blocked/quarantined, don't error.
     if current_state not in {"block", "quarantine"}:
-        action = EnforcementAction(
-            ip=request.ip,
-            mac=None,
-            action_type="block",
-            reason=request.reason,
-            created_at=datetime.utcnow(),
+        db.add(
+            EnforcementAction(
+                ip=request.ip,
+                mac=None,
+                action_type="block",
+                reason=request.reason,
+                created_at=now,
+            )
         )
-        db.add(action)
         await db.commit()
-        await db.refresh(action)
-        timestamp = action.created_at.isoformat()
-        state = action.action_type
+        state = "block"
     else:
-        timestamp = datetime.utcnow().isoformat()
         state = current_state
         note = f"Device {request.ip} was already {current_state}"
 
@@ -116,7 +115,7 @@ async def block_device(
         "state": state,
         "ip": request.ip,
         "reason": request.reason,
-        "timestamp": timestamp,
+        "timestamp": now.isoformat(),
     }
     if note:
         payload["note"] = note
@@ -144,7 +143,7 @@ async def unblock_device(
                 mac=None,
                 action_type="unblock",
                 reason=None,
-                created_at=datetime.utcnow(),
+                created_at=datetime.now(timezone.utc),
             )
         )
         await db.commit()
@@ -162,19 +161,27 @@ async def get_blocked_devices(
     db: AsyncSession = Depends(db_session),
     _user: User = Depends(require_compliance_role()),
 ) -> List[Dict[str, Any]]:
-    stmt = select(EnforcementAction).order_by(EnforcementAction.created_at.desc())
-    actions = (await db.execute(stmt)).scalars().all()
-
-    latest_by_ip: Dict[str, EnforcementAction] = {}
-    for action in actions:
-        if action.ip not in latest_by_ip:
-            latest_by_ip[action.ip] = action
+    # Latest action per IP (DISTINCT ON), then keep the ones that leave the
+    # device blocked.  The filter must sit outside the subquery: an IP whose
+    # most recent action is an unblock has to drop out entirely.
+    latest = (
+        select(EnforcementAction)
+        .ext(distinct_on(EnforcementAction.ip))
+        .order_by(
+            EnforcementAction.ip,
+            EnforcementAction.created_at.desc(),
+            EnforcementAction.id.desc(),
+        )
+        .subquery()
+    )
+    stmt = (
+        select(latest.c.ip, latest.c.mac, latest.c.action_type, latest.c.reason, latest.c.created_at)
+        .where(latest.c.action_type.in_(("block", "quarantine")))
+        .order_by(latest.c.created_at.desc())
+    )
 
     devices: List[Dict[str, Any]] = []
-    for ip, action in latest_by_ip.items():
-        if action.action_type not in {"block", "quarantine"}:
-            continue
-
+    for action in await db.execute(stmt):
         item: Dict[str, Any] = {
             "ip": action.ip,
             "reason": action.reason,
@@ -187,7 +194,6 @@ async def get_blocked_devices(
 
         devices.append(item)
 
-    devices.sort(key=lambda d: d.get("timestamp", ""), reverse=True)
     return devices
 
 
@@ -200,27 +206,28 @@ async def quarantine_device(
     if not _validate_ip(request.ip):
         raise HTTPException(status_code=400, detail="Invalid IP address format")
 
-    if not MAC_PATTERN.match(request.mac):
+    if not MAC_PATTERN.fullmatch(request.mac):
         raise HTTPException(status_code=400, detail="Invalid MAC address format")
 
-    action = EnforcementAction(
-        ip=request.ip,
-        mac=request.mac,
-        action_type="quarantine",
-        reason=request.reason,
-        created_at=datetime.utcnow(),
+    now = datetime.now(timezone.utc)
+    db.add(
+        EnforcementAction(
+            ip=request.ip,
+            mac=request.mac,
+            action_type="quarantine",
+            reason=request.reason,
+            created_at=now,
+        )
     )
-    db.add(action)
     await db.commit()
-    await db.refresh(action)
 
     return {
         "status": "quarantined",
-        "state": action.action_type,
+        "state": "quarantine",
         "ip": request.ip,
         "mac": request.mac,
         "reason": request.reason,
-        "timestamp": action.created_at.isoformat(),
+        "timestamp": now.isoformat(),
     }
 
 
@@ -232,10 +239,10 @@ async def arp_fix(
     if not _validate_ip(request.target_ip):
         raise HTTPException(status_code=400, detail="Invalid IP address format")
 
-    if not MAC_PATTERN.match(request.correct_mac):
+    if not MAC_PATTERN.fullmatch(request.correct_mac):
         raise HTTPException(status_code=400, detail="Invalid MAC address format")
 
-    arping_path = shutil.which("arping")
+    arping_path = resolve_tool("arping")
     if arping_path:
         try:
             proc = await asyncio.create_subprocess_exec(
@@ -289,23 +296,28 @@ async def _attempt_kick_worker(target_ip: str, duration_s: float) -> None:
     same L2 segment.
     """
 
-    def _kick() -> None:
-        import time
-
-        from app.services import arp_spoof
-
-        gateway_ip = settings.pulse_gateway_ip
-        if not _validate_ip(gateway_ip):
-            raise RuntimeError("Invalid pulse_gateway_ip setting")
-
-        session = arp_spoof.poison(target_ip, gateway_ip, iface=None, interval=1.0)
-        time.sleep(duration_s)
-        session.stop(restore_network=True)
+    gateway_ip = settings.pulse_gateway_ip
+    if not _validate_ip(gateway_ip):
+        logger.error("Attempt-kick failed for %s: invalid pulse_gateway_ip setting", target_ip)
+        return
 
     try:
-        await asyncio.to_thread(_kick)
+        session = await asyncio.to_thread(
+            arp_spoof.poison, target_ip, gateway_ip, iface=None, interval=1.0
+        )
     except Exception:
         logger.exception("Attempt-kick failed for %s", target_ip)
+        return
+
+    # The poison loop runs on its own thread; wait on the event loop rather
+    # than parking a default-executor thread for the whole duration.
+    try:
+        await asyncio.sleep(duration_s)
+    finally:
+        try:
+            await asyncio.to_thread(session.stop, restore_network=True)
+        except Exception:
+            logger.exception("Failed to restore ARP state after kicking %s", target_ip)
 
 
 @router.post("/attempt-kick")
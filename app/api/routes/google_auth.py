@@ -128,7 +128,6 @@ async def google_callback(
         )
         db.add(user)
         await db.commit()
-        await db.refresh(user)
         is_new_user = True
 
     if not user.is_active:
@@ -142,6 +141,7 @@ async def google_callback(
         subject=user.email,
         role=user.role.value,
         expires_delta=access_token_expires,
+        user_id=user.id,
     )
 
     return GoogleTokenResponse(
@@ -7,6 +7,7 @@ Exposes:
 - pulse_latest: latest per-target latency/jitter/loss snapshot for the Pulse panel.
 """
 
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
@@ -21,6 +22,11 @@ from app.models.metric import Metric
 
 router = APIRouter()
 
+# The latency monitor writes a new sample every 10 s, so dashboards polling
+# /pulse-latest within a few seconds of each other can share one result.
+_PULSE_CACHE_TTL_SECONDS = 5.0
+_pulse_cache: tuple[float, "PulseSummaryResponse"] | None = None
+
 
 class MetricPoint(BaseModel):
     timestamp: datetime
@@ -80,6 +86,10 @@ async def pulse_latest(
     db: AsyncSession = Depends(db_session),
 ) -> PulseSummaryResponse:
     """Return the latest latency, jitter and packet loss metrics per configured Pulse target."""
+    global _pulse_cache
+    if _pulse_cache is not None and time.monotonic() - _pulse_cache[0] < _PULSE_CACHE_TTL_SECONDS:
+        return _pulse_cache[1]
+
     metric_types = {"latency_ms", "jitter_ms", "packet_loss_pct"}
     now = datetime.utcnow()
     window_start = now - timedelta(minutes=15)
@@ -127,4 +137,6 @@ async def pulse_latest(
     ]
 
     summaries.sort(key=lambda s: s.label.lower())
-    return PulseSummaryResponse(targets=summaries)
+    response = PulseSummaryResponse(targets=summaries)
+    _pulse_cache = (time.monotonic(), response)
+    return response
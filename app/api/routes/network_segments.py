@@ -188,7 +188,6 @@ async def create_network_segment(
     )
     db.add(new_segment)
     await db.commit()
-    await db.refresh(new_segment)
     return new_segment
 
 
@@ -225,7 +224,6 @@ async def update_network_segment(
         setattr(existing, key, value)
 
     await db.commit()
-    await db.refresh(existing)
     return existing
 
 
@@ -3,7 +3,6 @@ from __future__ import annotations
 import ipaddress
 import re
 import shlex
-import shutil
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -15,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import db_session, get_current_user, require_admin
 from app.core.config import settings
+from app.core.tools import resolve_tool
 from app.db.session import async_session_factory
 from app.models.scan_job import ScanJob, ScanJobStatus
 from app.models.user import User
@@ -276,7 +276,7 @@ async def execute_nmap(
     db: AsyncSession = Depends(db_session),
     current_user: User = Depends(require_admin),
 ) -> ScanResult:
-    if not shutil.which("nmap"):
+    if not resolve_tool("nmap"):
         raise HTTPException(status_code=503, detail="nmap is not installed on this system")
 
     if not _validate_target(request.target):
@@ -309,7 +309,6 @@ async def execute_nmap(
     )
     db.add(job)
     await db.commit()
-    await db.refresh(job)
 
     scan_id = job.id
 
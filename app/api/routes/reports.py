@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import html
 import io
 import uuid
@@ -368,7 +369,8 @@ async def generate_report(
         result = await db.execute(select(Device).limit(100))
         devices = list(result.scalars().all())
 
-    pdf_content = _generate_pdf_content(
+    pdf_content = await asyncio.to_thread(
+        _generate_pdf_content,
         report_type=request.report_type,
         title=title,
         devices=devices,
@@ -416,7 +418,8 @@ async def generate_devices_pdf(
     result = await db.execute(select(Device).limit(500))
     devices = list(result.scalars().all())
 
-    pdf_content = _generate_pdf_content(
+    pdf_content = await asyncio.to_thread(
+        _generate_pdf_content,
         report_type="device_inventory",
         title="Device Inventory Report",
         devices=devices,
@@ -498,7 +501,7 @@ async def generate_logs_pdf(
         ]))
         elements.append(table)
 
-    doc.build(elements)
+    await asyncio.to_thread(doc.build, elements)
     buffer.seek(0)
 
     now = datetime.now()
@@ -570,7 +573,7 @@ async def generate_scan_pdf(
     else:
         elements.append(Paragraph("No results available.", styles['Normal']))
 
-    doc.build(elements)
+    await asyncio.to_thread(doc.build, elements)
     buffer.seek(0)
 
     now = datetime.now()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import os
 import re
 from pathlib import Path
@@ -10,10 +11,10 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import db_session, require_admin, require_compliance_role
+from app.api.uploads import iter_upload
 from app.core.config import settings
 from app.models.script_job import ScriptJob, ScriptJobStatus
 from app.models.user import User
-from app.tasks import execute_script_job_task
 
 router = APIRouter()
 
@@ -64,8 +65,17 @@ async def upload_script(
     sanitized = _sanitize_filename(file.filename)
     destination = scripts_dir / sanitized
 
-    content = await file.read()
-    destination.write_bytes(content)
+    # Stream to a temporary name so a rejected or aborted upload never leaves a
+    # truncated script where a job could pick it up.
+    partial = destination.with_name(destination.name + ".part")
+    try:
+        with open(partial, "wb") as fh:
+            async for chunk in iter_upload(file, settings.max_script_upload_bytes):
+                await asyncio.to_thread(fh.write, chunk)
+        await asyncio.to_thread(os.replace, partial, destination)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
 
     job = ScriptJob(
         script_name=file.filename,
@@ -74,7 +84,9 @@ async def upload_script(
     )
     db.add(job)
     await db.commit()
-    await db.refresh(job)
+
+    # Imported lazily: app.tasks pulls in Celery and every worker-side service.
+    from app.tasks import execute_script_job_task
 
     background_tasks.add_task(execute_script_job_task.delay, job.id)
     return {"job_id": job.id, "script_name": job.script_name}
@@ -146,7 +158,9 @@ async def run_prebuilt_script(
     )
     db.add(job)
     await db.commit()
-    await db.refresh(job)
+
+    # Imported lazily: app.tasks pulls in Celery and every worker-side service.
+    from app.tasks import execute_script_job_task
 
     background_tasks.add_task(execute_script_job_task.delay, job.id)
     return {"job_id": job.id, "script_name": safe_script_name}
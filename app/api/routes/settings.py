@@ -66,7 +66,6 @@ async def _upsert_user_settings(
             setattr(row, key, value)
 
     await db.commit()
-    await db.refresh(row)
     return row
 
 
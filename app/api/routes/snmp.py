@@ -2,13 +2,13 @@ from __future__ import annotations
 
 import asyncio
 import re
-import shutil
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
 from app.api.deps import get_current_user, require_admin
+from app.core.tools import resolve_tool
 from app.models.user import User
 
 router = APIRouter()
@@ -51,26 +51,30 @@ COMMUNITY_PATTERN = re.compile(r"^[\x21-\x7e]{1,64}$")
 OID_PATTERN = re.compile(r"^\d+(?:\.\d+)*$")
 ALLOWED_VERSIONS = {"1", "2c", "3"}
 
+_TYPED_LINE_PATTERN = re.compile(r"^(.+?)\s*=\s*(\w+):\s*(.*)$")
+_UNTYPED_LINE_PATTERN = re.compile(r"^(.+?)\s*=\s*(.*)$")
+_INSTANCE_SUFFIX_PATTERN = re.compile(r"\.\d+$")
+
 
 def _parse_snmp_line(line: str) -> Optional[Dict[str, Any]]:
     line = line.strip()
     if not line or "=" not in line:
         return None
-    match = re.match(r"^(.+?)\s*=\s*(\w+):\s*(.*)$", line)
+    match = _TYPED_LINE_PATTERN.match(line)
     if not match:
-        match_notype = re.match(r"^(.+?)\s*=\s*(.*)$", line)
+        match_notype = _UNTYPED_LINE_PATTERN.match(line)
         if match_notype:
             oid_part = match_notype.group(1).strip()
             value = match_notype.group(2).strip()
             label = oid_part.split("::")[-1] if "::" in oid_part else oid_part
-            label = re.sub(r"\.\d+$", "", label)
+            label = _INSTANCE_SUFFIX_PATTERN.sub("", label)
             return {"oid": oid_part, "label": label, "value": value, "type": "Unknown"}
         return None
     oid_part = match.group(1).strip()
     value_type = match.group(2).strip()
     value = match.group(3).strip().strip('"')
     label = oid_part.split("::")[-1] if "::" in oid_part else oid_part
-    label = re.sub(r"\.\d+$", "", label)
+    label = _INSTANCE_SUFFIX_PATTERN.sub("", label)
     return {"oid": oid_part, "label": label, "value": value, "type": value_type}
 
 
@@ -97,7 +101,7 @@ async def snmp_poll(
             raise HTTPException(status_code=400, detail=f"Invalid OID: {oid}")
         normalized_oids.append(oid)
 
-    snmpget_path = shutil.which("snmpget")
+    snmpget_path = resolve_tool("snmpget")
     if not snmpget_path:
         raise HTTPException(status_code=503, detail="snmpget is not installed on this system")
 
@@ -145,7 +149,7 @@ async def snmp_walk(
     if not OID_PATTERN.match(request_oid):
         raise HTTPException(status_code=400, detail="Invalid OID format")
 
-    snmpwalk_path = shutil.which("snmpwalk")
+    snmpwalk_path = resolve_tool("snmpwalk")
     if not snmpwalk_path:
         raise HTTPException(status_code=503, detail="snmpwalk is not installed on this system")
 
@@ -57,6 +57,11 @@ FACILITY_MAP = {
     23: "local7",
 }
 
+# RFC 3164 framing: "<PRI>rest", where rest is optionally "Mmm dd hh:mm:ss host msg".
+_PRI_PATTERN = re.compile(r"^<(\d+)>(.*)$")
+_BSD_HEADER_PATTERN = re.compile(r"^([A-Z][a-z]{2}\s+\d+\s+\d{2}:\d{2}:\d{2})\s+(\S+)\s+(.*)$")
+_HOST_PATTERN = re.compile(r"^(\S+)\s+(.*)$")
+
 
 def _parse_syslog_message(data: bytes, addr: tuple) -> Dict[str, Any]:
     raw = data.decode(errors="replace").strip()
@@ -67,7 +72,7 @@ def _parse_syslog_message(data: bytes, addr: tuple) -> Dict[str, Any]:
     hostname = source_ip
     message = raw
 
-    pri_match = re.match(r"^<(\d+)>(.*)$", raw)
+    pri_match = _PRI_PATTERN.match(raw)
     if pri_match:
         pri = int(pri_match.group(1))
         rest = pri_match.group(2)
@@ -76,15 +81,12 @@ def _parse_syslog_message(data: bytes, addr: tuple) -> Dict[str, Any]:
         facility = FACILITY_MAP.get(facility_num, f"facility-{facility_num}")
         severity = SEVERITY_MAP.get(severity_num, f"severity-{severity_num}")
 
-        ts_match = re.match(
-            r"^([A-Z][a-z]{2}\s+\d+\s+\d{2}:\d{2}:\d{2})\s+(\S+)\s+(.*)$",
-            rest,
-        )
+        ts_match = _BSD_HEADER_PATTERN.match(rest)
         if ts_match:
             hostname = ts_match.group(2)
             message = ts_match.group(3)
         else:
-            host_match = re.match(r"^(\S+)\s+(.*)$", rest)
+            host_match = _HOST_PATTERN.match(rest)
             if host_match:
                 hostname = host_match.group(1)
                 message = host_match.group(2)
@@ -237,7 +237,6 @@ async def run_manual_check(
         target.consecutive_failures += 1
 
     await db.commit()
-    await db.refresh(check)
 
     return UptimeCheckResponse(
         id=check.id,
@@ -14,10 +14,12 @@ from pathlib import Path
 from typing import Any, Set
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.deps import load_token_user
 from app.core.config import settings
 from app.db.session import async_session_factory
 from app.models.metric import Metric
@@ -38,15 +40,13 @@ async def _get_user_from_token(token: str, db: AsyncSession) -> User | None:
             settings.secret_key,
             algorithms=[settings.jwt_algorithm],
         )
-    except JWTError:
+    except InvalidTokenError:
         return None
 
-    email = payload.get("sub")
-    if not email:
+    if not payload.get("sub"):
         return None
 
-    result = await db.execute(select(User).where(User.email == email))
-    return result.scalar_one_or_none()
+    return await load_token_user(db, payload)
 
 
 @router.websocket("/scripts/{job_id}")
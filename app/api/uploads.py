@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+"""Size-limited reading of multipart file uploads.
+
+Starlette parses the multipart body before the handler runs, spooling each file
+to a ``SpooledTemporaryFile`` (memory up to 1 MiB, then disk).  The request as a
+whole is bounded by ``RequestValidationMiddleware`` from its Content-Length;
+:func:`iter_upload` then enforces the per-route limit on the file itself and
+lets handlers copy it out without loading it into memory in one piece.
+"""
+
+from typing import AsyncIterator
+
+from fastapi import HTTPException, UploadFile, status
+
+# Boundaries, part headers and the filename around the file itself.  Added to a
+# route's file limit to get its request-body cap so the file limit decides.
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+_UPLOAD_CHUNK_BYTES = 64 * 1024
+
+
+async def iter_upload(upload: UploadFile, max_bytes: int) -> AsyncIterator[bytes]:
+    """Yield a spooled upload in fixed-size chunks, failing with 413 past ``max_bytes``.
+
+    The body has already been received by the time this runs; the limit stops
+    an oversized file from being copied or decoded, and callers that write the
+    chunks out never hold more than one of them at a time.
+    """
+    received = 0
+    while chunk := await upload.read(_UPLOAD_CHUNK_BYTES):
+        received += len(chunk)
+        if received > max_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Upload exceeds the {max_bytes} byte limit",
+            )
+        yield chunk
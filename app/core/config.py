@@ -190,6 +190,12 @@ class Settings(BaseSettings):
     scripts_uploads_subdir: str = "uploads"
     scripts_prebuilt_subdir: str = "prebuilt"
 
+    # Upload size limits (bytes).  Each caps the uploaded file on its route and,
+    # plus multipart framing, the request body RequestValidationMiddleware
+    # accepts there; every other route keeps the middleware's 10 MiB cap.
+    max_script_upload_bytes: int = 10 * 1024 * 1024
+    max_backup_upload_bytes: int = 256 * 1024 * 1024
+
     # Packet capture storage
     pcap_storage_dir: str = "/tmp/pcaps"
     passive_monitor_iface: str = "eth0"
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+"""Lookup of external command-line tools (nmap, tcpdump, arping, snmpget...).
+
+``shutil.which`` walks every ``$PATH`` entry and stats each candidate; the
+answer does not change while a container is running, so it is resolved once
+per process.  Installing a tool into a running container therefore needs a
+restart before NetPulse notices it.
+"""
+
+import shutil
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def resolve_tool(name: str) -> str | None:
+    """Return the absolute path of ``name`` on ``$PATH``, or None if missing."""
+    return shutil.which(name)
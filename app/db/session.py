@@ -2,8 +2,7 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
 
@@ -20,10 +19,11 @@ engine: AsyncEngine = create_async_engine(
 )
 
 
-async_session_factory = sessionmaker(
+# expire_on_commit=False: handlers routinely serialise ORM objects after
+# commit(); expiring them would trigger a lazy re-SELECT per attribute access.
+async_session_factory = async_sessionmaker(
     bind=engine,
     expire_on_commit=False,
-    class_=AsyncSession,
 )
 
 
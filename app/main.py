@@ -24,20 +24,28 @@ from typing import AsyncGenerator
 from fastapi import FastAPI, HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse, FileResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
+from starlette.datastructures import Headers
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 from sqlalchemy import select
 
 from app.api.routes import api_router
+from app.api.uploads import MULTIPART_OVERHEAD_BYTES
+from app.api.routes.auth import login_rate_limit_exceeded
 from app.core.config import settings
 from app.core.redis import close_pool, init_pool
 from app.db.base import Base
 from app.db.session import engine, async_session_factory, get_db
+from app.services.audit_writer import run_audit_writer
+from app.services.packet_capture import shutdown_parse_pool
 from app.services.passive_monitor import run_passive_monitor
+from app.services.splunk_service import get_splunk_service
 from app.services.logging_service import setup_logging
 from app.api.deps import get_password_hash
 from app.models.user import User, UserRole
@@ -72,11 +80,25 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
 
     MAX_CONTENT_LENGTH = 10 * 1024 * 1024
 
+    # Upload routes are capped by their own file-size setting (plus multipart
+    # framing) rather than MAX_CONTENT_LENGTH; iter_upload applies the same
+    # setting to the file itself once Starlette has parsed the body.
+    UPLOAD_LIMIT_SETTINGS = {
+        "/api/backup/restore": "max_backup_upload_bytes",
+        "/api/scripts/upload": "max_script_upload_bytes",
+    }
+
+    def _limit_for(self, path: str) -> int:
+        setting = self.UPLOAD_LIMIT_SETTINGS.get(path)
+        if setting is None:
+            return self.MAX_CONTENT_LENGTH
+        return getattr(settings, setting) + MULTIPART_OVERHEAD_BYTES
+
     async def dispatch(self, request: Request, call_next) -> Response:
         content_length = request.headers.get("content-length")
         if content_length:
             try:
-                if int(content_length) > self.MAX_CONTENT_LENGTH:
+                if int(content_length) > self._limit_for(request.url.path):
                     return JSONResponse(
                         status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
                         content={"error": {"code": 413, "message": "Request too large"}}
@@ -87,6 +109,45 @@ class RequestValidationMiddleware(BaseHTTPMiddleware):
         return await call_next(request)
 
 
+class LoginRateLimitMiddleware:
+    """Pure ASGI sliding-window rate limit for ``POST /api/auth/login``.
+
+    Runs ahead of routing so throttled attempts are rejected without building a
+    Request object or resolving any FastAPI dependencies; every other request
+    is passed straight through.
+    """
+
+    LOGIN_PATH = "/api/auth/login"
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "POST" or scope["path"] != self.LOGIN_PATH:
+            await self.app(scope, receive, send)
+            return
+
+        # Extract real client IP, handling proxy headers
+        headers = Headers(scope=scope)
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        if x_forwarded_for := headers.get("x-forwarded-for"):
+            # X-Forwarded-For may contain multiple IPs; use the first (client) one
+            client_ip = x_forwarded_for.split(",")[0].strip()
+        elif x_real_ip := headers.get("x-real-ip"):
+            client_ip = x_real_ip.strip()
+
+        if await login_rate_limit_exceeded(client_ip):
+            response = JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={"error": {"code": 429, "message": "Too many login attempts. Please try again later."}},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """FastAPI lifespan handler.
@@ -137,7 +198,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                     username=settings.bootstrap_admin_username,
                     email=settings.bootstrap_admin_email,
                     full_name=settings.bootstrap_admin_full_name,
-                    hashed_password=get_password_hash(settings.bootstrap_admin_password),
+                    hashed_password=await get_password_hash(settings.bootstrap_admin_password),
                     role=UserRole.ADMIN,
                     force_password_change=True,
                 )
@@ -145,6 +206,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
                 await session.commit()  # type: ignore
     passive_monitor_task: asyncio.Task[None] | None = None
     peer_discovery_task: asyncio.Task[None] | None = None
+    audit_writer_task = asyncio.create_task(run_audit_writer())
     try:
         # Start peer discovery on the local network segment
         from app.services.peer_discovery import start_peer_discovery
@@ -162,6 +224,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             passive_monitor_task.cancel()
             with suppress(asyncio.CancelledError):
                 await passive_monitor_task
+        audit_writer_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await audit_writer_task
+        await get_splunk_service().close()
+        shutdown_parse_pool()
         await engine.dispose()
         await close_pool()
 
@@ -180,8 +247,14 @@ app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # ty
 from slowapi.middleware import SlowAPIMiddleware
 app.add_middleware(SlowAPIMiddleware)
 
+# Added before SecurityHeadersMiddleware so it sits inside it: the 429s it
+# short-circuits with still get the security headers.
+app.add_middleware(LoginRateLimitMiddleware)
 app.add_middleware(SecurityHeadersMiddleware)
 app.add_middleware(RequestValidationMiddleware)
+# Compress large JSON bodies (backup exports, capture/device lists); the
+# 1 KiB floor keeps small responses such as login tokens uncompressed.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 _cors_origins = (
     ["*"]
@@ -199,6 +272,8 @@ app.add_middleware(
     max_age=600,
 )
 
+# POST /api/auth/login is throttled by LoginRateLimitMiddleware above, before
+# routing, not by a dependency on the auth router.
 app.include_router(api_router, prefix="/api")
 
 
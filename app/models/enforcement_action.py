@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, Integer, String
+from sqlalchemy import DateTime, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -11,6 +11,11 @@ from app.db.base import Base
 
 class EnforcementAction(Base):
     __tablename__ = "enforcement_actions"
+    __table_args__ = (
+        # Serves "latest action for this IP" lookups and the DISTINCT ON scan
+        # behind the blocked-devices list.
+        Index("ix_enforcement_actions_ip_created_at", "ip", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     ip: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
@@ -4,6 +4,9 @@ import subprocess
 from datetime import datetime
 from typing import Any, Dict, List
 
+_IPV4_PATTERN = re.compile(r'(\d+\.\d+\.\d+\.\d+)')
+_MAC_PATTERN = re.compile(r'([0-9a-f]{2}(:[0-9a-f]{2}){5})', re.I)
+
 
 class ArpSpoofDetector:
     name = "ARP Spoof Detector"
@@ -55,8 +58,8 @@ class ArpSpoofDetector:
             if len(parts) >= 5 and parts[2] == 'lladdr':
                 entries[parts[0]] = parts[4]
             elif len(parts) >= 4:
-                ip_match = re.search(r'(\d+\.\d+\.\d+\.\d+)', line)
-                mac_match = re.search(r'([0-9a-f]{2}(:[0-9a-f]{2}){5})', line, re.I)
+                ip_match = _IPV4_PATTERN.search(line)
+                mac_match = _MAC_PATTERN.search(line)
                 if ip_match and mac_match:
                     entries[ip_match.group(1)] = mac_match.group(1)
         return entries
@@ -4,6 +4,8 @@ import subprocess
 from datetime import datetime
 from typing import Any, Dict, List
 
+_REMOTE_ADDR_PATTERN = re.compile(r'(\d+\.\d+\.\d+\.\d+):(\d+)')
+
 
 class PortKnockDetector:
     name = "Port Knock Detector"
@@ -30,7 +32,7 @@ class PortKnockDetector:
                 parts = line.split()
                 if len(parts) >= 5:
                     remote = parts[4] if len(parts) > 4 else parts[3]
-                    ip_match = re.match(r'(\d+\.\d+\.\d+\.\d+):(\d+)', remote)
+                    ip_match = _REMOTE_ADDR_PATTERN.match(remote)
                     if ip_match:
                         ip = ip_match.group(1)
                         port = int(ip_match.group(2))
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+"""Background writer for the admin audit trail.
+
+``require_admin`` drops one dict per privileged call onto an in-process queue;
+a single task started from the FastAPI lifespan drains it and persists rows in
+batches with one multi-row INSERT and one COMMIT per flush window, instead of a
+commit per admin request.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from sqlalchemy import insert
+
+from app.db.session import async_session_factory
+from app.models.audit_log import AuditLog
+
+logger = logging.getLogger(__name__)
+
+_FLUSH_INTERVAL_SECONDS = 0.1
+_MAX_BATCH_SIZE = 200
+_MAX_QUEUE_SIZE = 10_000
+
+# asyncio.Queue binds to the first event loop that waits on it, so one queue
+# per running loop: a second lifespan in the same process (another TestClient,
+# an embedded server restart) gets a fresh queue instead of a RuntimeError.
+_audit_queue: asyncio.Queue[dict[str, Any]] | None = None
+_audit_queue_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _get_queue() -> asyncio.Queue[dict[str, Any]]:
+    global _audit_queue, _audit_queue_loop
+    loop = asyncio.get_running_loop()
+    if _audit_queue is None or _audit_queue_loop is not loop:
+        _audit_queue = asyncio.Queue(maxsize=_MAX_QUEUE_SIZE)
+        _audit_queue_loop = loop
+    return _audit_queue
+
+
+def enqueue_audit_entry(entry: dict[str, Any]) -> None:
+    """Queue an audit row for the background writer without blocking."""
+    try:
+        _get_queue().put_nowait(entry)
+    except asyncio.QueueFull:
+        logger.warning("Audit queue full; dropping entry for %s", entry.get("action"))
+
+
+def _drain_nowait(queue: asyncio.Queue[dict[str, Any]], batch: list[dict[str, Any]]) -> None:
+    while len(batch) < _MAX_BATCH_SIZE:
+        try:
+            batch.append(queue.get_nowait())
+        except asyncio.QueueEmpty:
+            return
+
+
+async def _flush(batch: list[dict[str, Any]]) -> None:
+    try:
+        async with async_session_factory() as session:
+            await session.execute(insert(AuditLog), batch)
+            await session.commit()
+    except Exception as exc:
+        logger.warning("Failed to persist %d audit entries: %s", len(batch), exc)
+
+
+async def run_audit_writer() -> None:
+    """Drain the audit queue forever, flushing at most every 100 ms.
+
+    On cancellation the batch being written (if any) is allowed to finish and
+    any rows still queued are flushed before returning, so a clean shutdown
+    does not lose audit entries.
+    """
+    queue = _get_queue()
+    loop = asyncio.get_running_loop()
+    batch: list[dict[str, Any]] = []
+    in_flight: asyncio.Future[None] | None = None
+    try:
+        while True:
+            batch.append(await queue.get())
+            deadline = loop.time() + _FLUSH_INTERVAL_SECONDS
+            while len(batch) < _MAX_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Shielded so a shutdown cancel cannot abandon a batch halfway
+            # through its INSERT; the handler below waits for it instead.
+            in_flight = asyncio.ensure_future(_flush(batch))
+            await asyncio.shield(in_flight)
+            in_flight, batch = None, []
+    except asyncio.CancelledError:
+        if in_flight is not None:
+            await in_flight
+            batch = []
+        _drain_nowait(queue, batch)
+        while batch:
+            await _flush(batch)
+            batch = []
+            _drain_nowait(queue, batch)
+        raise
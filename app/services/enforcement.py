@@ -12,6 +12,7 @@ from app.services.splunk_service import get_splunk_service
 logger = logging.getLogger(__name__)
 
 _PORT_PATTERN = re.compile(r"^[A-Za-z0-9/_:-]{1,64}$")
+_HOSTNAME_PATTERN = re.compile(r"[A-Za-z0-9.-]{1,253}")
 
 
 def _validate_port_name(port: str) -> bool:
@@ -23,7 +24,7 @@ def _validate_host(host: str) -> bool:
         ipaddress.ip_address(host)
         return True
     except ValueError:
-        return bool(re.fullmatch(r"[A-Za-z0-9.-]{1,253}", host))
+        return bool(_HOSTNAME_PATTERN.fullmatch(host))
 
 
 async def isolate_switch_port(
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import asyncio
-import shutil
 import time
 from datetime import datetime
 from pathlib import Path
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.tools import resolve_tool
 from app.models.scan_job import ScanJob, ScanJobStatus
 
 SCANS_DIR = Path("data/scans")
@@ -36,7 +36,7 @@ async def run_scan_job(
     artifact_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Real Nmap execution path:
-    if not shutil.which("nmap"):
+    if not resolve_tool("nmap"):
         job.status = ScanJobStatus.FAILED
         job.completed_at = datetime.utcnow()
         job.result_summary = {
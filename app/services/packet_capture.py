@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import multiprocessing
 import os
 import shlex
-import shutil
 import subprocess
 import uuid
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -15,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.celery_app import celery_app
 from app.core.config import settings
+from app.core.tools import resolve_tool
 from app.models.packet_capture import PacketCapture, PacketCaptureStatus, PacketHeader
 from app.models.pcap_meta import PcapFile
 
@@ -82,7 +84,6 @@ async def capture_to_pcap(
     )
     db.add(capture)
     await db.commit()
-    await db.refresh(capture)
 
     try:
         packets = await _run_capture(
@@ -125,7 +126,6 @@ async def capture_to_pcap(
             pcap_file.captured_finished_at = capture.finished_at
 
         await db.commit()
-        await db.refresh(pcap_file)
 
         try:
             celery_app.send_task("app.tasks.index_pcap_file", args=[pcap_file.id])
@@ -164,7 +164,7 @@ async def _run_capture(
         The number of packets captured when using Scapy. When using tcpdump, this
         returns 0 (packet count will be derived during indexing).
     """
-    tcpdump_path = shutil.which("tcpdump")
+    tcpdump_path = resolve_tool("tcpdump")
     if tcpdump_path:
         await _run_tcpdump_capture(
             tcpdump_path=tcpdump_path,
@@ -273,6 +273,109 @@ async def _run_scapy_capture(
     return await loop.run_in_executor(None, _capture_sync)
 
 
+_parse_pool: ProcessPoolExecutor | None = None
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Return the process pool used for PCAP header parsing.
+
+    Scapy dissection is pure-Python CPU work; in a thread it still holds the GIL
+    and starves the event loop, so it runs in separate processes instead.
+
+    Workers are started via forkserver (spawn where that is unavailable) rather
+    than fork: the API process already runs executor, driver and to_thread
+    threads, and a forked child can deadlock on a lock one of them held.
+    """
+    global _parse_pool
+    if _parse_pool is None:
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _parse_pool = ProcessPoolExecutor(
+            max_workers=2, mp_context=multiprocessing.get_context(method)
+        )
+    return _parse_pool
+
+
+def shutdown_parse_pool() -> None:
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
+
+_PCAP_GLOBAL_HEADER_SIZE = 24
+_PCAP_MAGICS = frozenset({
+    b"\xd4\xc3\xb2\xa1",  # classic pcap, little-endian, microseconds
+    b"\xa1\xb2\xc3\xd4",  # classic pcap, big-endian, microseconds
+    b"\x4d\x3c\xb2\xa1",  # classic pcap, little-endian, nanoseconds
+    b"\xa1\xb2\x3c\x4d",  # classic pcap, big-endian, nanoseconds
+    b"\x0a\x0d\x0d\x0a",  # pcapng section header block
+})
+
+
+def sniff_pcap_file(filepath: str) -> Optional[str]:
+    """Cheaply check that ``filepath`` looks like a capture scapy can read.
+
+    Returns a short reason when it does not, or None when it does; a missing
+    file raises FileNotFoundError so callers can tell it apart from a bad one.
+    Only the first four bytes are read, so a bad file is rejected before any
+    work is handed to the parse pool.
+    """
+    with open(filepath, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size < _PCAP_GLOBAL_HEADER_SIZE:
+            return "Capture file is empty or truncated"
+        magic = fh.read(4)
+    if magic not in _PCAP_MAGICS:
+        return "Capture file is not a pcap or pcapng file"
+    return None
+
+
+def _parse_pcap_headers_sync(filepath: str, max_packets: int) -> list[dict]:
+    try:
+        from scapy.all import IP, IPv6, PcapReader, TCP, UDP
+
+        headers: list[dict] = []
+        reader = PcapReader(filepath)
+        try:
+            for pkt in reader:
+                if len(headers) >= max_packets:
+                    break
+
+                ip_layer = None
+                if IP in pkt:
+                    ip_layer = pkt[IP]
+                elif IPv6 in pkt:
+                    ip_layer = pkt[IPv6]
+
+                if ip_layer is None:
+                    continue
+
+                header_data: dict = {
+                    "timestamp": datetime.utcfromtimestamp(float(pkt.time)),
+                    "src_ip": getattr(ip_layer, "src", None),
+                    "dst_ip": getattr(ip_layer, "dst", None),
+                    "protocol": str(getattr(ip_layer, "proto", getattr(ip_layer, "nh", ""))),
+                    "length": len(pkt),
+                }
+
+                if TCP in pkt:
+                    header_data["src_port"] = pkt[TCP].sport
+                    header_data["dst_port"] = pkt[TCP].dport
+                    header_data["protocol"] = "TCP"
+                elif UDP in pkt:
+                    header_data["src_port"] = pkt[UDP].sport
+                    header_data["dst_port"] = pkt[UDP].dport
+                    header_data["protocol"] = "UDP"
+
+                headers.append(header_data)
+
+        finally:
+            reader.close()
+
+        return headers
+    except Exception:
+        return []
+
+
 async def parse_pcap_headers(
     db: AsyncSession,
     capture_id: int,
@@ -296,54 +399,10 @@ async def parse_pcap_headers(
     if not filepath.exists():
         return 0
 
-    def _parse_sync() -> list[dict]:
-        try:
-            from scapy.all import IP, IPv6, PcapReader, TCP, UDP
-
-            headers: list[dict] = []
-            reader = PcapReader(str(filepath))
-            try:
-                for pkt in reader:
-                    if len(headers) >= max_packets:
-                        break
-
-                    ip_layer = None
-                    if IP in pkt:
-                        ip_layer = pkt[IP]
-                    elif IPv6 in pkt:
-                        ip_layer = pkt[IPv6]
-
-                    if ip_layer is None:
-                        continue
-
-                    header_data: dict = {
-                        "timestamp": datetime.utcfromtimestamp(float(pkt.time)),
-                        "src_ip": getattr(ip_layer, "src", None),
-                        "dst_ip": getattr(ip_layer, "dst", None),
-                        "protocol": str(getattr(ip_layer, "proto", getattr(ip_layer, "nh", ""))),
-                        "length": len(pkt),
-                    }
-
-                    if TCP in pkt:
-                        header_data["src_port"] = pkt[TCP].sport
-                        header_data["dst_port"] = pkt[TCP].dport
-                        header_data["protocol"] = "TCP"
-                    elif UDP in pkt:
-                        header_data["src_port"] = pkt[UDP].sport
-                        header_data["dst_port"] = pkt[UDP].dport
-                        header_data["protocol"] = "UDP"
-
-                    headers.append(header_data)
-
-            finally:
-                reader.close()
-
-            return headers
-        except Exception:
-            return []
-
-    loop = asyncio.get_event_loop()
-    headers_data = await loop.run_in_executor(None, _parse_sync)
+    loop = asyncio.get_running_loop()
+    headers_data = await loop.run_in_executor(
+        _get_parse_pool(), _parse_pcap_headers_sync, str(filepath), max_packets
+    )
 
     for hdr in headers_data:
         packet_header = PacketHeader(
@@ -39,7 +39,7 @@ async def check_is_admin_password_changed() -> bool:
             if user:
                 return not user.force_password_change
     except Exception as e:
-        logger.error(f"Error checking admin password change status: {e}")
+        logger.error("Error checking admin password change status: %s", e)
     return False
 
 async def get_admin_hashed_password() -> str | None:
@@ -51,7 +51,7 @@ async def get_admin_hashed_password() -> str | None:
             if user:
                 return user.hashed_password
     except Exception as e:
-        logger.error(f"Error retrieving admin hashed password: {e}")
+        logger.error("Error retrieving admin hashed password: %s", e)
     return None
 
 async def update_admin_password(hashed_password: str) -> bool:
@@ -64,10 +64,10 @@ async def update_admin_password(hashed_password: str) -> bool:
                 user.hashed_password = hashed_password
                 user.force_password_change = False
                 await session.commit()
-                logger.warning(f"Admin credentials synchronized and updated from peer. Force password change disabled.")
+                logger.warning("Admin credentials synchronized and updated from peer. Force password change disabled.")
                 return True
     except Exception as e:
-        logger.error(f"Error updating admin password from peer: {e}")
+        logger.error("Error updating admin password from peer: %s", e)
     return False
 
 class PeerDiscoveryProtocol(asyncio.DatagramProtocol):
@@ -77,7 +77,7 @@ class PeerDiscoveryProtocol(asyncio.DatagramProtocol):
 
     def connection_made(self, transport):
         self.transport = transport
-        logger.info(f"Peer discovery UDP socket bound to port {UDP_PORT}")
+        logger.info("Peer discovery UDP socket bound to port %s", UDP_PORT)
 
     def datagram_received(self, data: bytes, addr: tuple[str, int]):
         asyncio.create_task(self.handle_message(data, addr))
@@ -93,13 +93,13 @@ class PeerDiscoveryProtocol(asyncio.DatagramProtocol):
             
             # Verify signature to protect against malicious network injection
             if not _verify_signature(payload, signature):
-                logger.warning(f"Received untrusted or unsigned peer message from {addr[0]}")
+                logger.warning("Received untrusted or unsigned peer message from %s", addr[0])
                 return
             
             # Verify timestamp to prevent replay attacks (30s window)
             current_time = time.time()
             if abs(current_time - payload.get("timestamp", 0)) > 30:
-                logger.warning(f"Replay attempt or out-of-sync clock message from {addr[0]}")
+                logger.warning("Replay attempt or out-of-sync clock message from %s", addr[0])
                 return
             
             # Prevent processing our own messages
@@ -115,7 +115,7 @@ class PeerDiscoveryProtocol(asyncio.DatagramProtocol):
                 await self.handle_sync_resp(payload, addr)
 
         except Exception as e:
-            logger.debug(f"Error parsing incoming peer message: {e}")
+            logger.debug("Error parsing incoming peer message: %s", e)
 
     async def handle_ping(self, payload: Dict[str, Any], addr: tuple[str, int]):
         peer_has_changed = payload.get("admin_password_changed", False)
@@ -123,7 +123,7 @@ class PeerDiscoveryProtocol(asyncio.DatagramProtocol):
         
         # If the peer has changed password but we haven't, request sync
         if peer_has_changed and not our_has_changed:
-            logger.info(f"Found peer {addr[0]} with changed admin credentials. Requesting sync...")
+            logger.info("Found peer %s with changed admin credentials. Requesting sync...", addr[0])
             await self.send_sync_req(addr)
 
     async def handle_sync_req(self, payload: Dict[str, Any], addr: tuple[str, int]):
@@ -199,7 +199,7 @@ async def start_peer_discovery() -> None:
     try:
         sock.bind(("0.0.0.0", UDP_PORT))
     except Exception as e:
-        logger.error(f"Failed to bind peer discovery socket: {e}")
+        logger.error("Failed to bind peer discovery socket: %s", e)
         sock.close()
         return
 
@@ -261,7 +261,6 @@ async def execute_script(
     job.status = ScriptJobStatus.RUNNING
     job.started_at = datetime.utcnow()
     await db.commit()
-    await db.refresh(job)
 
     script_path = Path(job.script_path)
     temp_file_path = None
@@ -396,4 +395,3 @@ if __name__ == "__main__":
         job.finished_at = datetime.utcnow()
 
         await db.commit()
-        await db.refresh(job)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Any
@@ -20,10 +21,32 @@ class SplunkService:
         self.source = settings.splunk_hec_source
         self.sourcetype = settings.splunk_hec_sourcetype
         self.verify_ssl = settings.splunk_hec_verify_ssl
+        self._client: httpx.AsyncClient | None = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
 
     def _ready(self) -> bool:
         return bool(self.enabled and self.url and self.token)
 
+    def _get_client(self) -> httpx.AsyncClient:
+        # One pooled client per event loop: telemetry is emitted per event, so a
+        # client per call would redo DNS + TCP + TLS for every HEC post.  Celery
+        # tasks run each job under a fresh asyncio.run() loop, hence the check.
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client_loop = loop
+            self._client = httpx.AsyncClient(
+                verify=self.verify_ssl,
+                timeout=5.0,
+                headers={"Authorization": f"Splunk {self.token}"},
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
     async def emit(self, event: dict[str, Any]) -> None:
         if not self._ready():
             return
@@ -37,11 +60,9 @@ class SplunkService:
             "event": event,
         }
 
-        headers = {"Authorization": f"Splunk {self.token}"}
         try:
-            async with httpx.AsyncClient(verify=self.verify_ssl, timeout=5.0) as client:
-                response = await client.post(self.url, json=payload, headers=headers)
-                response.raise_for_status()
+            response = await self._get_client().post(self.url, json=payload)
+            response.raise_for_status()
         except Exception as exc:  # noqa: BLE001
             logger.debug("Splunk HEC emit failed: %s", exc)
 
@@ -0,0 +1,14 @@
+-- NetPulse: composite index for per-IP enforcement state lookups
+--
+-- Adds the index declared in app/models/enforcement_action.py so that both
+-- "latest action for ip ORDER BY created_at DESC LIMIT 1" (block/unblock) and
+-- "DISTINCT ON (ip) ... ORDER BY ip, created_at DESC" (blocked devices list)
+-- are answered from the index instead of a sort over the whole table.
+--
+-- PostgreSQL.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_enforcement_actions_ip_created_at ON enforcement_actions (ip, created_at);
+
+COMMIT;
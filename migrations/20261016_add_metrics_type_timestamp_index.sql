@@ -0,0 +1,13 @@
+-- NetPulse: composite index for per-type metric lookups
+--
+-- Adds the index declared in app/models/metric.py so that
+-- "WHERE metric_type = ... ORDER BY timestamp DESC LIMIT n" (Pulse panel,
+-- Internet Health chart) resolves with one backward index range scan.
+--
+-- PostgreSQL.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_metrics_metric_type_timestamp ON metrics (metric_type, timestamp);
+
+COMMIT;
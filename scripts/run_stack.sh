@@ -44,7 +44,7 @@ start_proc() {
   pids+=("$pid")
 }
 
-start_proc "backend" python -m uvicorn app.main:app --reload --host 0.0.0.0 --port 8000
+start_proc "backend" python -m uvicorn app.main:app --reload --host 0.0.0.0 --port 8000 --loop uvloop --http httptools
 start_proc "worker" celery -A app.core.celery_app.celery_app worker -l info
 start_proc "beat" celery -A app.core.celery_app.celery_app beat -l info
 start_proc "frontend" bash -lc "cd frontend && npm run dev"
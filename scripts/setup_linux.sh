@@ -233,7 +233,8 @@ pip install -q \
   scapy \
   python-nmap \
   reportlab \
-  "python-jose[cryptography]" \
+  PyJWT \
+  orjson \
   "argon2-cffi" \
   slowapi \
   httpx
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services import audit_writer
+
+
+@pytest.fixture
+def flushed(monkeypatch) -> list[list[dict]]:
+    batches: list[list[dict]] = []
+
+    async def fake_flush(batch: list[dict]) -> None:
+        batches.append(list(batch))
+
+    monkeypatch.setattr(audit_writer, "_flush", fake_flush)
+    return batches
+
+
+@pytest.mark.asyncio
+async def test_writer_batches_up_to_max_size(flushed) -> None:
+    for i in range(450):
+        audit_writer.enqueue_audit_entry({"action": "test", "n": i})
+
+    task = asyncio.create_task(audit_writer.run_audit_writer())
+    await asyncio.sleep(audit_writer._FLUSH_INTERVAL_SECONDS * 3)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert [len(b) for b in flushed] == [200, 200, 50]
+    assert [row["n"] for b in flushed for row in b] == list(range(450))
+
+
+@pytest.mark.asyncio
+async def test_cancel_during_flush_keeps_batch(monkeypatch) -> None:
+    written: list[dict] = []
+    started = asyncio.Event()
+
+    async def slow_flush(batch: list[dict]) -> None:
+        started.set()
+        await asyncio.sleep(0.05)
+        written.extend(batch)
+
+    monkeypatch.setattr(audit_writer, "_flush", slow_flush)
+    for i in range(3):
+        audit_writer.enqueue_audit_entry({"action": "test", "n": i})
+
+    task = asyncio.create_task(audit_writer.run_audit_writer())
+    await started.wait()
+    # Queued after the first batch was taken: must be flushed on shutdown too.
+    audit_writer.enqueue_audit_entry({"action": "test", "n": 3})
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert [row["n"] for row in written] == [0, 1, 2, 3]
+
+
+def test_queue_survives_a_new_event_loop(flushed) -> None:
+    async def cycle(n: int) -> None:
+        audit_writer.enqueue_audit_entry({"action": "test", "n": n})
+        task = asyncio.create_task(audit_writer.run_audit_writer())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cycle(1))
+    asyncio.run(cycle(2))
+
+    assert [row["n"] for b in flushed for row in b] == [1, 2]
@@ -0,0 +1,48 @@
+"""
+Unit tests for the login flow in app/api/routes/auth.py.
+
+The auth module is loaded directly via importlib (see test_health.py) so
+that the route package __init__ does not import every other router.
+"""
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+
+
+def _load_auth_module():
+    spec = importlib.util.spec_from_file_location(
+        "auth_routes",
+        Path(__file__).parent.parent / "app" / "api" / "routes" / "auth.py",
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+auth = _load_auth_module()
+
+
+class _NoUserSession:
+    async def scalar(self, _stmt):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_unknown_user_still_pays_password_verification(monkeypatch) -> None:
+    verified: list[str] = []
+
+    async def _fake_verify(_plain: str, hashed: str) -> bool:
+        verified.append(hashed)
+        return False
+
+    monkeypatch.setattr(auth, "verify_password", _fake_verify)
+
+    with pytest.raises(HTTPException) as exc:
+        await auth.login(auth.LoginRequest(username="ghost", password="pw"), db=_NoUserSession())
+
+    assert exc.value.status_code == 401
+    assert verified == [auth._DUMMY_PASSWORD_HASH]
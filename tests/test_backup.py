@@ -0,0 +1,178 @@
+"""
+Round-trip tests for the backup export/restore routes in app/api/routes/backup.py.
+
+The backup module is loaded directly via importlib (see test_health.py) and
+driven with in-memory stand-ins for the AsyncSession, so no database is needed.
+"""
+from __future__ import annotations
+
+import importlib.util
+import io
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+import orjson
+import pytest
+from fastapi import HTTPException, UploadFile
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql.dml import Insert
+
+
+def _load_backup_module():
+    spec = importlib.util.spec_from_file_location(
+        "backup_routes",
+        Path(__file__).parent.parent / "app" / "api" / "routes" / "backup.py",
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+backup = _load_backup_module()
+
+
+class _StreamResult:
+    def __init__(self, partitions: list[list[dict]]) -> None:
+        self._partitions = partitions
+
+    def mappings(self) -> "_StreamResult":
+        return self
+
+    async def partitions(self):
+        for partition in self._partitions:
+            yield partition
+
+
+class _ExportSession:
+    """Serves each table as a list of partitions, or raises if given an exception."""
+
+    def __init__(self, tables: dict[str, list[list[dict]] | Exception]) -> None:
+        self._tables = tables
+
+    async def stream(self, statement):
+        source = self._tables[str(statement).rsplit(" ", 1)[-1]]
+        if isinstance(source, Exception):
+            raise source
+        return _StreamResult(source)
+
+
+class _RestoreSession:
+    """Records inserted rows per table; rows whose hostname is "bad" fail to insert."""
+
+    def __init__(self) -> None:
+        self.inserted: dict[str, list[dict]] = {}
+        self.committed = False
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        yield
+
+    async def execute(self, statement, params=None):
+        if not isinstance(statement, Insert):
+            return
+        rows = params if isinstance(params, list) else [params]
+        if any(row.get("hostname") == "bad" for row in rows):
+            raise IntegrityError("INSERT", params, Exception("duplicate key"))
+        self.inserted.setdefault(statement.table.name, []).extend(rows)
+
+    async def commit(self) -> None:
+        self.committed = True
+
+
+async def _export(tmp_path, monkeypatch, tables) -> bytes:
+    monkeypatch.setattr(backup, "BACKUP_DIR", tmp_path)
+    response = await backup.export_db(db=_ExportSession(tables), current_user=None)
+    assert not list(tmp_path.glob("*.part"))
+    return Path(response.path).read_bytes()
+
+
+async def _restore(content: bytes, db: _RestoreSession) -> dict:
+    upload = UploadFile(file=io.BytesIO(content), filename="netpulse_backup.json")
+    return await backup.restore_db(file=upload, db=db, current_user=None)
+
+
+_DEVICES = [
+    {"id": 1, "hostname": "core-sw", "ip_address": "10.0.0.1", "is_gateway": True},
+    {"id": 2, "hostname": "ap-1", "ip_address": "10.0.0.2", "is_gateway": False},
+    {"id": 3, "hostname": None, "ip_address": "10.0.0.3", "is_gateway": False},
+]
+
+
+@pytest.mark.asyncio
+async def test_export_round_trips_through_restore(tmp_path, monkeypatch) -> None:
+    content = await _export(
+        tmp_path,
+        monkeypatch,
+        {
+            "devices": [_DEVICES[:2], _DEVICES[2:]],
+            "uptime_targets": [],
+            "network_segments": RuntimeError("relation does not exist"),
+        },
+    )
+
+    assert orjson.loads(content) == {
+        "devices": _DEVICES,
+        "uptime_targets": [],
+        "network_segments": [],
+    }
+
+    db = _RestoreSession()
+    result = await _restore(content, db)
+
+    assert result == {
+        "status": "restored",
+        "tables": {"devices": 3, "uptime_targets": 0, "network_segments": 0},
+    }
+    assert db.inserted == {"devices": _DEVICES}
+    assert db.committed
+
+
+@pytest.mark.asyncio
+async def test_export_of_only_empty_tables_is_valid_json(tmp_path, monkeypatch) -> None:
+    content = await _export(
+        tmp_path,
+        monkeypatch,
+        {"devices": [], "uptime_targets": [], "network_segments": []},
+    )
+    assert orjson.loads(content) == {"devices": [], "uptime_targets": [], "network_segments": []}
+
+
+@pytest.mark.asyncio
+async def test_restore_skips_only_the_rows_that_fail(tmp_path) -> None:
+    rows = [*_DEVICES[:2], {"id": 9, "hostname": "bad", "ip_address": "10.0.0.9", "is_gateway": False}]
+    db = _RestoreSession()
+
+    result = await _restore(orjson.dumps({"devices": rows}), db)
+
+    assert result["tables"] == {"devices": 2}
+    assert db.inserted == {"devices": _DEVICES[:2]}
+
+
+@pytest.mark.asyncio
+async def test_datetimes_export_as_rfc3339_and_restore_as_datetimes(tmp_path, monkeypatch) -> None:
+    seen = datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc)
+    created = datetime(2024, 1, 2, 3, 4, 5)
+    row = {"id": 1, "ip_address": "10.0.0.1", "last_seen": seen, "created_at": created}
+
+    content = await _export(
+        tmp_path,
+        monkeypatch,
+        {"devices": [[row]], "uptime_targets": [], "network_segments": []},
+    )
+
+    exported = orjson.loads(content)["devices"][0]
+    assert exported["last_seen"] == "2024-05-06T07:08:09.123456+00:00"
+    assert exported["created_at"] == "2024-01-02T03:04:05"
+
+    db = _RestoreSession()
+    await _restore(content, db)
+    assert db.inserted == {"devices": [row]}
+
+
+@pytest.mark.asyncio
+async def test_restore_rejects_malformed_timestamps(tmp_path) -> None:
+    content = orjson.dumps({"devices": [{"id": 1, "last_seen": "yesterday"}]})
+    with pytest.raises(HTTPException) as exc_info:
+        await _restore(content, _RestoreSession())
+    assert exc_info.value.status_code == 400
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import time
+
+from app.api import deps
+
+
+def _payload() -> dict:
+    return {
+        "id": 7,
+        "username": "ops",
+        "email": "ops@example.com",
+        "full_name": None,
+        "role": "operator",
+        "is_active": True,
+        "force_password_change": False,
+    }
+
+
+def test_token_cache_roundtrip() -> None:
+    deps.invalidate_cached_token("tok")
+    deps._token_cache_put("tok", int(time.time()) + 3600, _payload())
+    cached = deps._token_cache_get("tok")
+    assert cached is not None
+    user = deps._user_from_cache(cached)
+    assert user.id == 7
+    assert user.username == "ops"
+
+
+def test_token_cache_honours_token_expiry() -> None:
+    deps._token_cache_put("expired", int(time.time()) - 1, _payload())
+    assert deps._token_cache_get("expired") is None
+
+
+def test_token_cache_invalidate() -> None:
+    deps._token_cache_put("gone", int(time.time()) + 3600, _payload())
+    deps.invalidate_cached_token("gone")
+    assert deps._token_cache_get("gone") is None
@@ -0,0 +1,60 @@
+"""
+Tests for LoginRateLimitMiddleware in app/main.py.
+
+The real application stack is exercised (without running its lifespan) so the
+tests also pin the middleware order: throttled logins must come back through
+SecurityHeadersMiddleware.  The Redis-backed limiter is replaced per test.
+"""
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+
+
+@pytest.fixture
+def limiter_calls(monkeypatch) -> list[str]:
+    calls: list[str] = []
+
+    async def _always_exceeded(client_ip: str) -> bool:
+        calls.append(client_ip)
+        return True
+
+    monkeypatch.setattr(main, "login_rate_limit_exceeded", _always_exceeded)
+    return calls
+
+
+@pytest.fixture
+def client() -> TestClient:
+    return TestClient(main.app)
+
+
+def test_throttled_login_returns_429_with_security_headers(client, limiter_calls) -> None:
+    response = client.post("/api/auth/login", json={"username": "a", "password": "b"})
+
+    assert response.status_code == 429
+    assert response.json()["error"]["code"] == 429
+    assert response.headers["X-Content-Type-Options"] == "nosniff"
+    assert response.headers["X-Frame-Options"] == "SAMEORIGIN"
+    assert response.headers["Cache-Control"].startswith("no-store")
+    assert len(limiter_calls) == 1
+
+
+def test_rate_limit_keys_on_first_forwarded_hop(client, limiter_calls) -> None:
+    client.post(
+        "/api/auth/login",
+        json={"username": "a", "password": "b"},
+        headers={"X-Forwarded-For": "203.0.113.7, 10.0.0.2, 10.0.0.1"},
+    )
+    assert limiter_calls == ["203.0.113.7"]
+
+
+@pytest.mark.parametrize(
+    ("method", "path"),
+    [("GET", "/api/auth/login"), ("POST", "/api/auth/logout")],
+)
+def test_other_requests_bypass_the_limiter(client, limiter_calls, method, path) -> None:
+    response = client.request(method, path)
+    assert response.status_code != 429
+    assert limiter_calls == []
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+from app.services.packet_capture import sniff_pcap_file
+
+
+def _write(tmp_path, data: bytes) -> str:
+    path = tmp_path / "capture.pcap"
+    path.write_bytes(data)
+    return str(path)
+
+
+def _pcap_global_header(magic: bytes) -> bytes:
+    # magic, version 2.4, thiszone, sigfigs, snaplen, linktype (Ethernet)
+    return magic + struct.pack("<HHiIII", 2, 4, 0, 0, 65535, 1)
+
+
+@pytest.mark.parametrize(
+    "magic",
+    [b"\xd4\xc3\xb2\xa1", b"\xa1\xb2\xc3\xd4", b"\x4d\x3c\xb2\xa1", b"\xa1\xb2\x3c\x4d", b"\x0a\x0d\x0d\x0a"],
+)
+def test_accepts_pcap_and_pcapng_magics(tmp_path, magic) -> None:
+    assert sniff_pcap_file(_write(tmp_path, _pcap_global_header(magic))) is None
+
+
+def test_rejects_empty_file(tmp_path) -> None:
+    assert sniff_pcap_file(_write(tmp_path, b"")) == "Capture file is empty or truncated"
+
+
+def test_rejects_truncated_header(tmp_path) -> None:
+    truncated = _pcap_global_header(b"\xd4\xc3\xb2\xa1")[:20]
+    assert sniff_pcap_file(_write(tmp_path, truncated)) == "Capture file is empty or truncated"
+
+
+def test_rejects_unknown_magic(tmp_path) -> None:
+    not_pcap = b"PK\x03\x04" + bytes(40)
+    assert sniff_pcap_file(_write(tmp_path, not_pcap)) == "Capture file is not a pcap or pcapng file"
+
+
+def test_missing_file_raises(tmp_path) -> None:
+    with pytest.raises(FileNotFoundError):
+        sniff_pcap_file(str(tmp_path / "missing.pcap"))
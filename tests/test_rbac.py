@@ -24,3 +24,8 @@ async def test_scan_role_rejects_auditor() -> None:
     user = _user(UserRole.AUDITOR)
     with pytest.raises(HTTPException):
         await dep(user)
+
+
+def test_role_dependencies_are_shared() -> None:
+    assert require_compliance_role() is require_compliance_role()
+    assert require_scan_role() is not require_compliance_role()
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from app.api.uploads import _UPLOAD_CHUNK_BYTES, iter_upload
+
+
+async def _collect(upload: UploadFile, max_bytes: int) -> bytes:
+    return b"".join([chunk async for chunk in iter_upload(upload, max_bytes)])
+
+
+@pytest.mark.asyncio
+async def test_iter_upload_yields_whole_file_within_limit() -> None:
+    data = b"x" * (_UPLOAD_CHUNK_BYTES * 2 + 10)
+    upload = UploadFile(file=io.BytesIO(data), filename="backup.json")
+    assert await _collect(upload, len(data)) == data
+
+
+@pytest.mark.asyncio
+async def test_iter_upload_rejects_oversized_file_with_413() -> None:
+    upload = UploadFile(file=io.BytesIO(b"x" * 101), filename="backup.json")
+    with pytest.raises(HTTPException) as exc_info:
+        await _collect(upload, 100)
+    assert exc_info.value.status_code == 413
+    assert "100 byte limit" in exc_info.value.detail